@@ -22,12 +22,16 @@ Wire Format (RFC 9174 compliant for Wireshark compatibility):
 """
 
 import logging
+import os
+import queue
+import selectors
 import socket
 import struct
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import BinaryIO
 
 from ..core.bundle import Bundle
 from ..core.eid import EndpointID
@@ -38,6 +42,45 @@ TCPCL_MAGIC = b'dtn!'
 # Protocol version
 TCPCL_VERSION = 4
 
+# Socket receive buffer size per connection
+RECV_BUFFER_SIZE = 128 * 1024
+
+# Completed transfers that may wait for delivery before the receive
+# thread stops reading, pushing back on the sender through TCP
+DELIVER_QUEUE_DEPTH = 64
+
+# Kernel send/receive buffer size requested for TCPCL sockets; large
+# enough for the bandwidth-delay product of long-haul links
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Reassembly slots per connection; transfer IDs map to slot
+# (transfer_id & _XFER_SLOT_MASK), collisions go to an overflow dict
+_XFER_SLOTS = 64
+_XFER_SLOT_MASK = _XFER_SLOTS - 1
+
+# Most memory a declared transfer or segment length may reserve before
+# its data arrives; longer ones are received in pieces of this size
+_XFER_PREALLOC_LIMIT = 16 * 1024 * 1024
+
+# Bundles per gathered write in send_bundles(); two buffers each, kept
+# well under the usual IOV_MAX of 1024
+_SEND_BATCH_BUNDLES = 256
+
+# Linux-only; lets the sendall fallback coalesce header and data
+_TCP_CORK = getattr(socket, 'TCP_CORK', None)
+
+# Precompiled wire layouts (network byte order)
+_CONTACT_HDR = struct.Struct('!4sBB')        # magic, version, flags
+_SESS_INIT_HDR = struct.Struct('!BHQQH')     # type, keepalive, seg MRU, xfer MRU, node_len
+_XFER_SEG_HDR = struct.Struct('!BBQIQ')      # type, flags, xfer_id, ext_len, data_len
+_XFER_SEG_PREFIX = struct.Struct('!BBQ')     # type, flags, xfer_id
+_EXT_ITEMS_LEN = struct.Struct('!I')       # extension items length
+_EXT_ITEM_HDR = struct.Struct('!BHH')        # item flags, item type, item length
+_XFER_SEG_DATA_LEN = struct.Struct('!Q')
+_XFER_ACK = struct.Struct('!BBQQ')           # type, flags, xfer_id, ack_len
+_XFER_REFUSE = struct.Struct('!BBQ')         # type, reason, xfer_id
+_SESS_TERM = struct.Struct('!BBB')           # type, flags, reason
+
 
 class TCPCLMessageType(IntEnum):
     """TCPCL v4 Message Types per RFC 9174 Section 4.2."""
@@ -56,6 +99,17 @@ class XferSegmentFlags(IntEnum):
     START = 0x02    # Start of bundle
 
 
+class XferRefuseReason(IntEnum):
+    """Transfer refusal reasons per RFC 9174 Section 5.2.4."""
+    UNKNOWN = 0x00
+    COMPLETED = 0x01
+    NO_RESOURCES = 0x02
+    RETRANSMIT = 0x03
+    NOT_ACCEPTABLE = 0x04
+    EXTENSION_FAILURE = 0x05
+    SESSION_TERMINATING = 0x06
+
+
 class SessionTermReason(IntEnum):
     """Session termination reasons per RFC 9174."""
     UNKNOWN = 0x00
@@ -66,7 +120,77 @@ class SessionTermReason(IntEnum):
     RESOURCE_EXHAUSTION = 0x05
 
 
-@dataclass
+# Plain-int copies for the per-message receive path, where IntEnum
+# attribute lookups and comparisons would add overhead
+_MT_XFER_SEGMENT = int(TCPCLMessageType.XFER_SEGMENT)
+_MT_XFER_ACK = int(TCPCLMessageType.XFER_ACK)
+_MT_XFER_REFUSE = int(TCPCLMessageType.XFER_REFUSE)
+_MT_KEEPALIVE = int(TCPCLMessageType.KEEPALIVE)
+_MT_SESS_TERM = int(TCPCLMessageType.SESS_TERM)
+_MT_SESS_INIT = int(TCPCLMessageType.SESS_INIT)
+_FLAG_START = int(XferSegmentFlags.START)
+_FLAG_END = int(XferSegmentFlags.END)
+
+# Total length of messages without variable-length fields
+_FIXED_MSG_LEN = {
+    _MT_XFER_ACK: _XFER_ACK.size,       # type + flags + transfer_id + ack_len
+    _MT_XFER_REFUSE: _XFER_REFUSE.size, # type + reason + transfer_id
+    _MT_KEEPALIVE: 1,                   # type only
+    _MT_SESS_TERM: _SESS_TERM.size,     # type + flags + reason
+}
+
+
+# Transfer extension item type carrying the total transfer length
+XFER_EXT_TRANSFER_LENGTH = 0x0001
+
+
+def _transfer_length(ext_items: bytes) -> int | None:
+    """
+    Find the Transfer Length extension in XFER_SEGMENT extension items.
+
+    Item format per RFC 9174 Section 5.2.5:
+        flags: 1 byte
+        item_type: 2 bytes (uint16)
+        item_length: 2 bytes (uint16)
+        value: item_length bytes
+
+    Returns:
+        Declared total transfer length, or None if not present
+    """
+    pos = 0
+    while pos + _EXT_ITEM_HDR.size <= len(ext_items):
+        _, item_type, item_len = _EXT_ITEM_HDR.unpack_from(ext_items, pos)
+        pos += _EXT_ITEM_HDR.size
+        if item_type == XFER_EXT_TRANSFER_LENGTH and item_len == 8:
+            return int.from_bytes(ext_items[pos:pos + 8], 'big')
+        pos += item_len
+    return None
+
+
+def _parse_xfer_segment(header: bytes) -> tuple[int, int, int, int]:
+    """
+    Extract the fixed fields of an XFER_SEGMENT header.
+
+    Args:
+        header: Message bytes from msg_type through data_len
+
+    Returns:
+        (flags, transfer_id, ext_items_len, data_len)
+    """
+    if len(header) == _XFER_SEG_HDR.size:
+        # START segment without extension items: one unpack covers every field
+        _, flags, transfer_id, ext_len, data_len = _XFER_SEG_HDR.unpack(header)
+        return flags, transfer_id, ext_len, data_len
+
+    _, flags, transfer_id = _XFER_SEG_PREFIX.unpack_from(header)
+    ext_len = 0
+    if flags & _FLAG_START:
+        ext_len = _EXT_ITEMS_LEN.unpack_from(header, _XFER_SEG_PREFIX.size)[0]
+    data_len = _XFER_SEG_DATA_LEN.unpack_from(header, len(header) - 8)[0]
+    return flags, transfer_id, ext_len, data_len
+
+
+@dataclass(slots=True)
 class ContactHeader:
     """
     TCPCL v4 Contact Header per RFC 9174 Section 4.1.
@@ -80,31 +204,33 @@ class ContactHeader:
 
     def encode(self) -> bytes:
         """Encode contact header for transmission."""
-        return (
-            TCPCL_MAGIC +
-            struct.pack('!B', TCPCL_VERSION) +
-            struct.pack('!B', self.flags)
-        )
+        return _CONTACT_HDR.pack(TCPCL_MAGIC, TCPCL_VERSION, self.flags)
 
     @classmethod
     def decode(cls, data: bytes) -> 'ContactHeader':
         """Decode contact header from received data."""
-        if len(data) < 6:
+        if len(data) < _CONTACT_HDR.size:
             raise ValueError("Contact header too short")
 
-        magic = data[0:4]
+        magic, version, flags = _CONTACT_HDR.unpack_from(data)
         if magic != TCPCL_MAGIC:
             raise ValueError(f"Invalid magic: {magic}")
 
-        version = data[4]
         if version != TCPCL_VERSION:
             raise ValueError(f"Unsupported version: {version}")
 
-        flags = data[5]
         return cls(flags=flags)
 
 
-@dataclass
+# Fixed-content messages, encoded once at import
+_CONTACT_HEADER_DEFAULT = ContactHeader().encode()
+_SESS_TERM_MSGS = {
+    reason: _SESS_TERM.pack(TCPCLMessageType.SESS_TERM, 0, reason)
+    for reason in SessionTermReason
+}
+
+
+@dataclass(slots=True)
 class SessionInit:
     """
     TCPCL v4 Session Initialization Message per RFC 9174 Section 4.3.
@@ -127,28 +253,36 @@ class SessionInit:
     def encode(self) -> bytes:
         """Encode session init message."""
         node_bytes = self.node_id.encode('utf-8')
-        return (
-            struct.pack('!B', TCPCLMessageType.SESS_INIT) +
-            struct.pack('!H', self.keepalive_interval) +
-            struct.pack('!Q', self.segment_mru) +
-            struct.pack('!Q', self.transfer_mru) +
-            struct.pack('!H', len(node_bytes)) +
-            node_bytes +
-            struct.pack('!I', 0)  # Extension items length = 0
+        node_end = _SESS_INIT_HDR.size + len(node_bytes)
+
+        # Trailing 4 bytes stay zero: extension items length = 0
+        buf = bytearray(node_end + 4)
+        _SESS_INIT_HDR.pack_into(
+            buf, 0,
+            TCPCLMessageType.SESS_INIT,
+            self.keepalive_interval,
+            self.segment_mru,
+            self.transfer_mru,
+            len(node_bytes),
         )
+        buf[_SESS_INIT_HDR.size:node_end] = node_bytes
+        return bytes(buf)
 
     @classmethod
     def decode(cls, data: bytes) -> 'SessionInit':
         """Decode session init message."""
-        if data[0] != TCPCLMessageType.SESS_INIT:
+        if len(data) < _SESS_INIT_HDR.size:
+            raise ValueError("SESS_INIT message too short")
+
+        msg_type, keepalive, segment_mru, transfer_mru, node_len = (
+            _SESS_INIT_HDR.unpack_from(data)
+        )
+        if msg_type != TCPCLMessageType.SESS_INIT:
             raise ValueError("Not a SESS_INIT message")
 
-        keepalive = struct.unpack('!H', data[1:3])[0]
-        segment_mru = struct.unpack('!Q', data[3:11])[0]
-        transfer_mru = struct.unpack('!Q', data[11:19])[0]
-        node_len = struct.unpack('!H', data[19:21])[0]
-        node_id = data[21:21+node_len].decode('utf-8')
-        # Extension items length at 21+node_len, we skip it
+        node_start = _SESS_INIT_HDR.size
+        node_id = str(data[node_start:node_start + node_len], 'utf-8')
+        # Extension items length follows the node ID, we skip it
 
         return cls(
             keepalive_interval=keepalive,
@@ -170,30 +304,107 @@ class TCPCLConnection:
         sock: socket.socket,
         local_eid: EndpointID,
         on_bundle_received: Callable[[Bundle], None] | None = None,
+        recv_buffer_size: int = RECV_BUFFER_SIZE,
+        sess_init: bytes | None = None,
     ):
         self.sock = sock
         self.local_eid = local_eid
         self.remote_eid: EndpointID | None = None
         self.on_bundle_received = on_bundle_received
 
+        # Encoded SESS_INIT for local_eid; a convergence layer encodes it
+        # once and shares it between all of its connections
+        if sess_init is None:
+            sess_init = SessionInit(node_id=str(local_eid)).encode()
+        self._sess_init = sess_init
+        # Inbound segments and transfers longer than this side advertised
+        # are refused
+        local_init = SessionInit.decode(sess_init)
+        self._segment_mru = local_init.segment_mru
+        self._transfer_mru = local_init.transfer_mru
+
         self._running = False
         self._recv_thread: threading.Thread | None = None
+
+        # Completed transfers are decoded and delivered on a separate
+        # thread so the receive thread only does socket I/O and framing.
+        # None tells the delivery thread to exit. The semaphore bounds the
+        # number of queued transfers; SimpleQueue itself is unbounded.
+        self._deliver_queue: queue.SimpleQueue[bytes | bytearray | None] = queue.SimpleQueue()
+        self._deliver_slots = threading.Semaphore(DELIVER_QUEUE_DEPTH)
+        self._deliver_thread: threading.Thread | None = None
+
         self._transfer_id = 0
-        self._pending_transfers: dict[int, bytearray] = {}
+        # In-progress inbound transfers as [transfer_id, buffer, offset,
+        # fragments]; see _handle_xfer_segment
+        self._xfer_slots: list[list | None] = [None] * _XFER_SLOTS
+        self._xfer_overflow: dict[int, list] = {}
+
+        # Outbound fixed-size headers are packed into one reused buffer;
+        # the lock keeps messages from different threads from interleaving
+        self._send_lock = threading.Lock()
+        self._send_buf = bytearray(_XFER_SEG_HDR.size)
+        self._send_view = memoryview(self._send_buf)
+
+        # Bound once: scatter/gather send, None where unavailable (Windows)
+        self._sendmsg = getattr(sock, 'sendmsg', None)
+
+        # XFER_ACKs waiting to be sent; flushed together once every
+        # message already buffered has been handled
+        self._ack_buf = bytearray()
+
+        # Receive buffer; unread bytes live in _rbuf[_rhead:_rtail].
+        # Larger buffers take more queued messages per system call.
+        self._rbuf = bytearray(recv_buffer_size)
+        self._rview = memoryview(self._rbuf)
+        self._rhead = 0
+        self._rtail = 0
 
         self.logger = logging.getLogger(f"tcpcl.{id(self)}")
 
-    def start(self) -> None:
-        """Start the connection handler."""
+    def start(self, wait_for_session: bool = True) -> None:
+        """
+        Start the connection handler.
+
+        Args:
+            wait_for_session: Exchange contact headers and SESS_INIT before
+                returning. When False the exchange runs on the receive
+                thread, so a caller accepting many peers is not held up by
+                a slow handshake.
+        """
         self._running = True
-        self._exchange_contact_headers()
-        self._exchange_session_init()
+        if wait_for_session:
+            self._exchange_contact_headers()
+            self._exchange_session_init()
+            target = self._receive_loop
+        else:
+            target = self._establish_and_receive
 
-        # Start receive thread
-        self._recv_thread = threading.Thread(target=self._receive_loop)
+        # Start delivery and receive threads
+        self._deliver_thread = threading.Thread(target=self._deliver_loop)
+        self._deliver_thread.daemon = True
+        self._deliver_thread.start()
+
+        self._recv_thread = threading.Thread(target=target)
         self._recv_thread.daemon = True
         self._recv_thread.start()
 
+    def _establish_and_receive(self) -> None:
+        """Run the session handshake, then the receive loop."""
+        try:
+            self._exchange_contact_headers()
+            self._exchange_session_init()
+        except Exception as e:
+            self.logger.error("Session establishment failed: %s", e)
+            self._running = False
+            self._deliver_queue.put(None)
+            try:
+                self.sock.close()
+            except Exception:
+                pass
+            return
+        self._receive_loop()
+
     def stop(self) -> None:
         """Stop the connection handler."""
         self._running = False
@@ -206,160 +417,321 @@ class TCPCLConnection:
     def _exchange_contact_headers(self) -> None:
         """Exchange contact headers with peer."""
         # Send our contact header (6 bytes per RFC 9174)
-        header = ContactHeader()
-        self.sock.sendall(header.encode())
+        self._send_small(_CONTACT_HEADER_DEFAULT)
 
         # Receive peer's contact header (6 bytes)
-        data = self._recv_exact(6)
+        data = self._recv_view(_CONTACT_HDR.size)
         peer_header = ContactHeader.decode(data)
-        self.logger.info(f"Peer contact flags: 0x{peer_header.flags:02x}")
+        self.logger.info("Peer contact flags: 0x%02x", peer_header.flags)
 
     def _exchange_session_init(self) -> None:
         """Exchange session initialization messages."""
         # Send our session init
-        init = SessionInit(node_id=str(self.local_eid))
-        self.sock.sendall(init.encode())
+        self._send_small(self._sess_init)
 
         # Receive peer's session init
         data = self._recv_message()
         peer_init = SessionInit.decode(data)
         self.remote_eid = EndpointID.parse(peer_init.node_id)
-        self.logger.info(f"Connected to peer: {self.remote_eid}")
+        self.logger.info("Connected to peer: %s", self.remote_eid)
 
-    def _recv_exact(self, n: int) -> bytes:
-        """Receive exactly n bytes from socket."""
-        chunks = []
-        remaining = n
-        while remaining > 0:
-            chunk = self.sock.recv(min(remaining, 65536))
-            if not chunk:
+    def _fill(self, n: int) -> None:
+        """
+        Block until at least n unread bytes are buffered.
+
+        Each recv_into pulls as much as the socket has ready, so a burst
+        of small messages is served by one system call.
+        """
+        while self._rtail - self._rhead < n:
+            if self._rhead + n > len(self._rbuf):
+                # Move unread bytes to the front, growing for oversized messages
+                unread = self._rbuf[self._rhead:self._rtail]
+                if n > len(self._rbuf):
+                    self._rview.release()
+                    self._rbuf = bytearray(n)
+                    self._rview = memoryview(self._rbuf)
+                self._rbuf[:len(unread)] = unread
+                self._rhead = 0
+                self._rtail = len(unread)
+
+            if self._ack_buf:
+                self._flush_xfer_acks()
+            received = self.sock.recv_into(self._rview[self._rtail:])
+            if not received:
                 raise ConnectionError("Connection closed during receive")
-            chunks.append(chunk)
-            remaining -= len(chunk)
-        return b''.join(chunks)
-
-    def _recv_message(self) -> bytes:
-        """Receive a complete TCPCL message."""
-        # First byte is message type
-        msg_type_byte = self._recv_exact(1)
-        if not msg_type_byte:
-            raise ConnectionError("Connection closed")
-
-        msg_type = msg_type_byte[0]
-
-        if msg_type == TCPCLMessageType.SESS_INIT:
-            # SESS_INIT: keepalive(2) + segment_mru(8) + transfer_mru(8) + node_len(2)
-            header = self._recv_exact(20)
-            node_len = struct.unpack('!H', header[18:20])[0]
-            node_data = self._recv_exact(node_len)
-            # Extension items length (4 bytes)
-            ext_len_data = self._recv_exact(4)
-            ext_len = struct.unpack('!I', ext_len_data)[0]
-            ext_data = self._recv_exact(ext_len) if ext_len > 0 else b''
-            return msg_type_byte + header + node_data + ext_len_data + ext_data
-
-        elif msg_type == TCPCLMessageType.XFER_SEGMENT:
-            # XFER_SEGMENT: flags(1) + transfer_id(8)
-            header = self._recv_exact(9)
-            flags = header[0]
-
-            # If START flag, read extension items
-            ext_data = b''
-            if flags & XferSegmentFlags.START:
-                ext_len_data = self._recv_exact(4)
-                ext_len = struct.unpack('!I', ext_len_data)[0]
-                ext_data = ext_len_data + (self._recv_exact(ext_len) if ext_len > 0 else b'')
-
-            # Data length (8 bytes, uint64)
-            data_len_bytes = self._recv_exact(8)
-            data_len = struct.unpack('!Q', data_len_bytes)[0]
-
-            # Bundle data
-            data = self._recv_exact(data_len)
-
-            return msg_type_byte + header + ext_data + data_len_bytes + data
-
-        elif msg_type == TCPCLMessageType.XFER_ACK:
-            # XFER_ACK: flags(1) + transfer_id(8) + ack_len(8)
-            return msg_type_byte + self._recv_exact(17)
-
-        elif msg_type == TCPCLMessageType.KEEPALIVE:
-            return msg_type_byte
-
-        elif msg_type == TCPCLMessageType.SESS_TERM:
-            # SESS_TERM: flags(1) + reason(1)
-            return msg_type_byte + self._recv_exact(2)
+            self._rtail += received
+
+    def _recv_into(self, view: memoryview) -> None:
+        """Fill view with exactly len(view) bytes from the connection."""
+        n = len(view)
+        if n <= len(self._rbuf):
+            self._fill(n)
+            view[:] = self._rview[self._rhead:self._rhead + n]
+            self._rhead += n
+            return
+
+        # Larger than the receive buffer: hand over what is buffered, then
+        # let the kernel write the rest straight into the destination
+        received = self._rtail - self._rhead
+        view[:received] = self._rview[self._rhead:self._rtail]
+        self._rhead = self._rtail = 0
+
+        if self._ack_buf:
+            self._flush_xfer_acks()
+        while received < n:
+            chunk_len = self.sock.recv_into(view[received:])
+            if not chunk_len:
+                raise ConnectionError("Connection closed during receive")
+            received += chunk_len
+
+    def _recv_exact(self, n: int) -> bytearray:
+        """Receive exactly n bytes from socket."""
+        if n <= len(self._rbuf):
+            self._fill(n)
+            start = self._rhead
+            self._rhead += n
+            return self._rbuf[start:self._rhead]
+
+        data = bytearray(n)
+        self._recv_into(memoryview(data))
+        return data
+
+    def _recv_view(self, n: int) -> memoryview:
+        """
+        Receive exactly n bytes as a view, without copying when buffered.
+
+        The view aliases the receive buffer and is only valid until the
+        next read from the connection.
+        """
+        if n <= len(self._rbuf):
+            self._fill(n)
+            start = self._rhead
+            self._rhead += n
+            return self._rview[start:self._rhead]
+        return memoryview(self._recv_exact(n))
+
+    def _skip(self, n: int) -> None:
+        """Discard the next n bytes from the connection."""
+        while n:
+            chunk = min(n, len(self._rbuf))
+            self._fill(chunk)
+            self._rhead += chunk
+            n -= chunk
+
+    def _recv_message(self) -> memoryview:
+        """
+        Receive a complete TCPCL message as a view into the receive buffer.
+
+        Length fields are read in place from the receive buffer to find
+        where the message ends; the message is then taken in one piece.
+        For XFER_SEGMENT only the header (up to and including the data
+        length) is returned; _handle_xfer_segment reads the data itself.
+        """
+        fill = self._fill
+        fill(1)
+        msg_type = self._rbuf[self._rhead]
+
+        if msg_type == _MT_XFER_SEGMENT:
+            # type(1) + flags(1) + transfer_id(8)
+            fill(10)
+            length = 10
+
+            # If START flag, extension items length (4 bytes) + items
+            if self._rbuf[self._rhead + 1] & _FLAG_START:
+                fill(14)
+                ext_len = _EXT_ITEMS_LEN.unpack_from(self._rbuf, self._rhead + 10)[0]
+                length = 14 + ext_len
+
+            # Data length (8 bytes, uint64); bundle data is not consumed here
+            length += 8
+
+        elif msg_type in _FIXED_MSG_LEN:
+            length = _FIXED_MSG_LEN[msg_type]
+
+        elif msg_type == _MT_SESS_INIT:
+            # type(1) + keepalive(2) + segment_mru(8) + transfer_mru(8) + node_len(2)
+            fill(_SESS_INIT_HDR.size)
+            node_len = _SESS_INIT_HDR.unpack_from(self._rbuf, self._rhead)[4]
+            # Extension items length (4 bytes) follows the node ID
+            length = _SESS_INIT_HDR.size + node_len
+            fill(length + 4)
+            ext_len = _EXT_ITEMS_LEN.unpack_from(self._rbuf, self._rhead + length)[0]
+            length += 4 + ext_len
 
         else:
             raise ValueError(f"Unknown message type: {msg_type}")
 
+        return self._recv_view(length)
+
     def _receive_loop(self) -> None:
         """Main receive loop."""
+        recv_message = self._recv_message
+        handle_message = self._handle_message
         while self._running:
             try:
-                data = self._recv_message()
-                self._handle_message(data)
+                handle_message(recv_message())
             except ConnectionError:
                 self.logger.info("Connection closed by peer")
                 break
             except Exception as e:
-                self.logger.error(f"Receive error: {e}")
+                self.logger.error("Receive error: %s", e)
                 break
 
+        # Transfers completed since the last receive are still owed an
+        # XFER_ACK; the peer may be gone, so this is best effort
+        if self._ack_buf:
+            try:
+                self._flush_xfer_acks()
+            except OSError as e:
+                self.logger.debug("Could not send final acknowledgments: %s", e)
+
         self._running = False
+        self._deliver_queue.put(None)  # Deliver what was received, then exit
 
-    def _handle_message(self, data: bytes) -> None:
+    def _handle_message(self, data: memoryview) -> None:
         """Handle a received TCPCL message."""
         msg_type = data[0]
 
-        if msg_type == TCPCLMessageType.XFER_SEGMENT:
+        if msg_type == _MT_XFER_SEGMENT:
             self._handle_xfer_segment(data)
-        elif msg_type == TCPCLMessageType.XFER_ACK:
+        elif msg_type == _MT_XFER_ACK:
             self.logger.debug("Received transfer ACK")
-        elif msg_type == TCPCLMessageType.KEEPALIVE:
+        elif msg_type == _MT_XFER_REFUSE:
+            # Every transfer is sent as a single segment, so none is left
+            # part-sent; the refusal is only reported
+            _, reason, transfer_id = _XFER_REFUSE.unpack(data)
+            self.logger.warning("Transfer %d refused by peer (reason %d)", transfer_id, reason)
+        elif msg_type == _MT_KEEPALIVE:
             self.logger.debug("Received keepalive")
-        elif msg_type == TCPCLMessageType.SESS_TERM:
+        elif msg_type == _MT_SESS_TERM:
             self.logger.info("Received session termination")
+            # Acknowledge transfers that arrived with the SESS_TERM
+            if self._ack_buf:
+                self._flush_xfer_acks()
             self._running = False
 
-    def _handle_xfer_segment(self, data: bytes) -> None:
-        """Handle a transfer segment message."""
-        flags = data[1]
-        transfer_id = struct.unpack('!Q', data[2:10])[0]
-
-        # Calculate offset to bundle data
-        offset = 10
-        if flags & XferSegmentFlags.START:
-            # Skip extension items length (4 bytes) + any extensions
-            ext_len = struct.unpack('!I', data[10:14])[0]
-            offset = 14 + ext_len
-
-        # Skip data length field (8 bytes) - we already read the data
-        offset += 8
-
-        segment_data = data[offset:]
-
-        # Initialize buffer for new transfer
-        if flags & XferSegmentFlags.START:
-            self._pending_transfers[transfer_id] = bytearray()
+    def _handle_xfer_segment(self, header: memoryview) -> None:
+        """
+        Handle a transfer segment message.
 
-        # Append data
-        if transfer_id in self._pending_transfers:
-            self._pending_transfers[transfer_id].extend(segment_data)
+        The segment data is still on the socket and is received directly
+        into memory owned by the transfer. If the peer declared the total
+        length, segments land in one presized buffer; otherwise each
+        segment gets its own buffer and the fragments are joined once at
+        the end, so the data is never re-copied as the transfer grows.
+        """
+        flags, transfer_id, ext_len, data_len = _parse_xfer_segment(header)
+
+        slots = self._xfer_slots
+        index = transfer_id & _XFER_SLOT_MASK
+
+        if flags & _FLAG_START:
+            total_len = _transfer_length(header[14:14 + ext_len])
+            if total_len and total_len > self._transfer_mru:
+                entry = None
+            elif total_len:
+                # The declared length is the peer's claim, so it presizes
+                # the buffer only up to a limit
+                entry = [transfer_id, bytearray(min(total_len, _XFER_PREALLOC_LIMIT)), 0, None]
+            else:
+                entry = [transfer_id, None, 0, []]
+            slot = slots[index]
+            if slot is None or slot[0] == transfer_id:
+                slots[index] = entry
+            self._xfer_overflow.pop(transfer_id, None)
+            if entry is None:
+                self._refuse_transfer(transfer_id, data_len)
+                return
+            if slots[index] is not entry:
+                self._xfer_overflow[transfer_id] = entry
+        else:
+            entry = slots[index]
+            if entry is None or entry[0] != transfer_id:
+                entry = self._xfer_overflow.get(transfer_id)
+
+        if entry is None:
+            # Unknown transfer: consume and drop the data
+            self._skip(data_len)
+            return
+
+        _, buf, offset, fragments = entry
+        end = offset + data_len
+        if end > self._transfer_mru or data_len > self._segment_mru:
+            self._discard_transfer(index, entry)
+            self._refuse_transfer(transfer_id, data_len)
+            return
+
+        # Memory is taken in bounded pieces as data arrives, never on the
+        # strength of the declared segment length alone
+        if fragments is not None:
+            remaining = data_len
+            while remaining:
+                fragment = bytearray(min(remaining, _XFER_PREALLOC_LIMIT))
+                self._recv_into(memoryview(fragment))
+                fragments.append(fragment)
+                remaining -= len(fragment)
+        else:
+            while offset < end:
+                stop = min(end, max(len(buf), offset + _XFER_PREALLOC_LIMIT))
+                if stop > len(buf):
+                    buf.extend(bytes(stop - len(buf)))  # Past the presized part
+                self._recv_into(memoryview(buf)[offset:stop])
+                offset = stop
+        entry[2] = end
 
         # Complete transfer
-        if flags & XferSegmentFlags.END:
-            bundle_data = bytes(self._pending_transfers.pop(transfer_id))
-            self._send_xfer_ack(transfer_id, len(bundle_data))
+        if flags & _FLAG_END:
+            self._discard_transfer(index, entry)
+
+            if fragments is not None:
+                bundle_data = b''.join(fragments)
+            else:
+                del buf[end:]  # Declared length may exceed what was sent
+                bundle_data = buf
+            self._queue_xfer_ack(transfer_id, end)
+
+            # The data is no longer referenced here; the delivery
+            # thread takes ownership. If it is behind, acknowledge what
+            # has arrived before waiting for room.
+            if not self._deliver_slots.acquire(blocking=False):
+                if self._ack_buf:
+                    self._flush_xfer_acks()
+                self._deliver_slots.acquire()
+            self._deliver_queue.put(bundle_data)
+
+    def _discard_transfer(self, index: int, entry: list) -> None:
+        """Forget an inbound transfer's reassembly state."""
+        if self._xfer_slots[index] is entry:
+            self._xfer_slots[index] = None
+        else:
+            del self._xfer_overflow[entry[0]]
+
+    def _refuse_transfer(self, transfer_id: int, data_len: int) -> None:
+        """
+        Discard a segment's data and refuse the rest of its transfer.
 
-            # Decode and deliver bundle
+        Later segments of the transfer find no reassembly state and are
+        skipped; the session itself carries on.
+        """
+        self.logger.warning("Refusing transfer %d: exceeds advertised MRU", transfer_id)
+        self._skip(data_len)
+        with self._send_lock:
+            self._send_small(_XFER_REFUSE.pack(
+                _MT_XFER_REFUSE, XferRefuseReason.NO_RESOURCES, transfer_id
+            ))
+
+    def _deliver_loop(self) -> None:
+        """Decode completed transfers and pass bundles to the callback."""
+        while (bundle_data := self._deliver_queue.get()) is not None:
+            self._deliver_slots.release()
             try:
                 bundle = Bundle.decode(bundle_data)
-                self.logger.info(f"Received bundle: {bundle.bundle_id}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Received bundle: %s", bundle.bundle_id)
                 if self.on_bundle_received:
                     self.on_bundle_received(bundle)
             except Exception as e:
-                self.logger.error(f"Failed to decode bundle: {e}")
+                self.logger.error("Failed to decode bundle: %s", e)
 
     def send_bundle(self, bundle: Bundle) -> None:
         """
@@ -373,57 +745,187 @@ class TCPCLConnection:
             data_len: 8 bytes (uint64)
             data: variable
         """
-        self._transfer_id += 1
-        transfer_id = self._transfer_id
-
-        # Encode bundle
+        # Encoded afresh: blocks may have changed since an earlier send
         bundle_data = bundle.encode()
 
-        # Send as single segment (START + END flags)
-        flags = XferSegmentFlags.START | XferSegmentFlags.END
-        msg = (
-            struct.pack('!B', TCPCLMessageType.XFER_SEGMENT) +
-            struct.pack('!B', flags) +
-            struct.pack('!Q', transfer_id) +
-            struct.pack('!I', 0) +  # Extension items length = 0 (required when START)
-            struct.pack('!Q', len(bundle_data)) +  # 8-byte length per RFC 9174
-            bundle_data
+        with self._send_lock:
+            self._pack_single_segment(len(bundle_data))
+            self._send_gather(self._send_view, bundle_data)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sent bundle: %s", bundle.bundle_id)
+
+    def send_bundles(self, bundles: Iterable[Bundle]) -> int:
+        """
+        Send several bundles, each as its own single-segment transfer.
+
+        The segment headers and bundle data go out in one gathered write
+        per batch instead of a send per bundle, which matters for streams
+        of small bundles.
+
+        Returns:
+            Number of bundles sent
+        """
+        count = 0
+        buffers: list[bytes] = []
+        with self._send_lock:
+            for bundle in bundles:
+                bundle_data = bundle.encode()
+                self._transfer_id += 1
+                buffers.append(_XFER_SEG_HDR.pack(
+                    TCPCLMessageType.XFER_SEGMENT,
+                    XferSegmentFlags.START | XferSegmentFlags.END,
+                    self._transfer_id,
+                    0,  # Extension items length = 0 (required when START)
+                    len(bundle_data),
+                ))
+                buffers.append(bundle_data)
+                count += 1
+                if count % _SEND_BATCH_BUNDLES == 0:
+                    self._send_gather(*buffers)
+                    buffers.clear()
+            if buffers:
+                self._send_gather(*buffers)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sent %d bundles", count)
+        return count
+
+    def send_bundle_file(
+        self, file: BinaryIO, offset: int = 0, count: int | None = None
+    ) -> None:
+        """
+        Send an already-encoded bundle stored in a file.
+
+        For store-and-forward nodes that keep encoded bundles on disk: the
+        bundle bytes go straight from the file to the socket with
+        socket.sendfile (os.sendfile where available) instead of being
+        read into memory first.
+
+        Args:
+            file: Binary file opened for reading
+            offset: Position of the encoded bundle in the file
+            count: Encoded bundle length (default: rest of the file)
+        """
+        if count is None:
+            count = os.fstat(file.fileno()).st_size - offset
+
+        with self._send_lock:
+            self._pack_single_segment(count)
+            self._send_small(self._send_view)
+            self.sock.sendfile(file, offset, count)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sent bundle file: %d bytes", count)
+
+    def _pack_single_segment(self, data_len: int) -> None:
+        """Pack a START|END XFER_SEGMENT header into the send buffer."""
+        self._transfer_id += 1
+        _XFER_SEG_HDR.pack_into(
+            self._send_buf, 0,
+            TCPCLMessageType.XFER_SEGMENT,
+            XferSegmentFlags.START | XferSegmentFlags.END,
+            self._transfer_id,
+            0,  # Extension items length = 0 (required when START)
+            data_len,  # 8-byte length per RFC 9174
         )
 
-        self.sock.sendall(msg)
-        self.logger.info(f"Sent bundle: {bundle.bundle_id}")
+    def _send_gather(self, *buffers: bytes) -> None:
+        """
+        Send buffers back to back without joining them first.
 
-    def _send_xfer_ack(self, transfer_id: int, length: int) -> None:
+        Uses sendmsg scatter/gather so the bundle data is never copied into
+        a combined message; falls back to one sendall per buffer where
+        sendmsg is unavailable (Windows).
         """
-        Send transfer acknowledgment.
+        sendmsg = self._sendmsg
+        if sendmsg is None:
+            self._send_each(buffers)
+            return
+
+        # Common case: the kernel takes everything in one call
+        sent = sendmsg(buffers)
+        if sent == sum(map(len, buffers)):
+            return
+
+        views = [memoryview(buf) for buf in buffers]
+        while True:
+            # Drop fully sent buffers, then trim a partially sent one
+            while views and sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            if not views:
+                return
+            if sent:
+                views[0] = views[0][sent:]
+            sent = sendmsg(views)
+
+    def _send_small(self, buf: bytes) -> None:
+        """
+        Send a short control message.
+
+        A blocking send of a few bytes virtually always completes in one
+        call, so sendall's loop is only used to finish a short write.
+        """
+        sent = self.sock.send(buf)
+        if sent != len(buf):
+            self.sock.sendall(memoryview(buf)[sent:])
+
+    def _send_each(self, buffers: tuple[bytes, ...]) -> None:
+        """Send buffers with one sendall each, corked where supported."""
+        corked = False
+        if _TCP_CORK is not None:
+            try:
+                self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 1)
+                corked = True
+            except OSError:
+                pass
+        try:
+            for buf in buffers:
+                self.sock.sendall(buf)
+        finally:
+            if corked:
+                self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 0)
+
+    def _queue_xfer_ack(self, transfer_id: int, length: int) -> None:
+        """
+        Queue a transfer acknowledgment.
 
         Wire format per RFC 9174:
             msg_type: 1 byte (0x02)
             flags: 1 byte
             transfer_id: 8 bytes (uint64)
             ack_len: 8 bytes (uint64)
+
+        Sent by _flush_xfer_acks before the receive path next blocks, so
+        a burst of small bundles is acknowledged with one send.
         """
-        msg = (
-            struct.pack('!B', TCPCLMessageType.XFER_ACK) +
-            struct.pack('!B', 0) +  # flags
-            struct.pack('!Q', transfer_id) +
-            struct.pack('!Q', length)
-        )
-        self.sock.sendall(msg)
+        self._ack_buf += _XFER_ACK.pack(_MT_XFER_ACK, 0, transfer_id, length)
+
+    def _flush_xfer_acks(self) -> None:
+        """Send all queued transfer acknowledgments."""
+        with self._send_lock:
+            self._send_small(self._ack_buf)
+        self._ack_buf.clear()
 
     def _send_session_term(self, reason: SessionTermReason) -> None:
         """Send session termination message."""
-        msg = (
-            struct.pack('!B', TCPCLMessageType.SESS_TERM) +
-            struct.pack('!B', 0) +  # flags
-            struct.pack('!B', reason)
-        )
         try:
-            self.sock.sendall(msg)
+            with self._send_lock:
+                self._send_small(_SESS_TERM_MSGS[reason])
         except Exception:
             pass
 
 
+def _tune_socket(sock: socket.socket) -> None:
+    """
+    Apply TCPCL socket options.
+
+    Disables Nagle so small control messages (XFER_ACK, SESS_TERM) are not
+    held back, and enlarges the kernel buffers. Buffer sizes must be set
+    before connect()/listen() to affect the TCP window scale.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+
+
 class TCPConvergenceLayer:
     """
     TCP Convergence Layer Adapter.
@@ -435,17 +937,32 @@ class TCPConvergenceLayer:
         self,
         local_eid: EndpointID,
         listen_port: int = 4556,  # IANA assigned TCPCL port
+        recv_buffer_size: int = RECV_BUFFER_SIZE,
+        reuse_port: bool = False,
     ):
         self.local_eid = local_eid
         self.listen_port = listen_port
+        self.recv_buffer_size = recv_buffer_size
+        # SO_REUSEPORT lets several agent processes share the listen port,
+        # with the kernel spreading incoming connections between them
+        self.reuse_port = reuse_port
 
-        self._connections: dict[str, TCPCLConnection] = {}
+        self._connections: dict[EndpointID, TCPCLConnection] = {}
         self._server_sock: socket.socket | None = None
         self._running = False
         self._accept_thread: threading.Thread | None = None
 
+        # Accept loop waits on the listen socket and a wakeup pair,
+        # so stop() interrupts it immediately
+        self._selector: selectors.BaseSelector | None = None
+        self._wakeup_recv: socket.socket | None = None
+        self._wakeup_send: socket.socket | None = None
+
         self._bundle_handlers: list[Callable[[Bundle], None]] = []
 
+        # Same for every connection, so encoded once
+        self._sess_init = SessionInit(node_id=str(local_eid)).encode()
+
         self.logger = logging.getLogger("tcpcl")
 
     def add_bundle_handler(self, handler: Callable[[Bundle], None]) -> None:
@@ -459,14 +976,23 @@ class TCPConvergenceLayer:
         # Start listening server
         self._server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            self._server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        _tune_socket(self._server_sock)  # buffer sizes are inherited on accept
         self._server_sock.bind(('0.0.0.0', self.listen_port))
-        self._server_sock.listen(5)
+        self._server_sock.listen(socket.SOMAXCONN)
+        self._server_sock.setblocking(False)
+
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server_sock, selectors.EVENT_READ)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
 
         self._accept_thread = threading.Thread(target=self._accept_loop)
         self._accept_thread.daemon = True
         self._accept_thread.start()
 
-        self.logger.info(f"TCPCL listening on port {self.listen_port}")
+        self.logger.info("TCPCL listening on port %d", self.listen_port)
 
     def stop(self) -> None:
         """Stop the convergence layer."""
@@ -476,46 +1002,82 @@ class TCPConvergenceLayer:
         for conn in self._connections.values():
             conn.stop()
 
+        # Wake the accept loop and wait for it to exit
+        if self._wakeup_send:
+            self._wakeup_send.send(b'\x00')
+        if self._accept_thread:
+            self._accept_thread.join()
+
         # Close server socket
         if self._server_sock:
             self._server_sock.close()
+        if self._selector:
+            self._selector.close()
+        for sock in (self._wakeup_recv, self._wakeup_send):
+            if sock:
+                sock.close()
 
     def _accept_loop(self) -> None:
         """Accept incoming connections."""
         while self._running:
+            for key, _ in self._selector.select():
+                if key.fileobj is self._wakeup_recv:
+                    return
+
+                self._accept_pending()
+
+    def _accept_pending(self) -> None:
+        """Accept every connection queued on the listen socket."""
+        while True:
             try:
-                self._server_sock.settimeout(1.0)
                 client_sock, addr = self._server_sock.accept()
-                self.logger.info(f"Accepted connection from {addr}")
+            except BlockingIOError:
+                return  # Backlog drained
+            except Exception as e:
+                if self._running:
+                    self.logger.error("Accept error: %s", e)
+                return
+
+            try:
+                # The listener is non-blocking, and on BSD/macOS the
+                # accepted socket inherits O_NONBLOCK; the connection
+                # threads expect blocking I/O. Socket options, TCP_NODELAY
+                # included, were set on the listener and are inherited.
+                client_sock.setblocking(True)
+                self.logger.info("Accepted connection from %s", addr)
 
                 conn = TCPCLConnection(
                     sock=client_sock,
                     local_eid=self.local_eid,
                     on_bundle_received=self._on_bundle_received,
+                    recv_buffer_size=self.recv_buffer_size,
+                    sess_init=self._sess_init,
                 )
-                conn.start()
-
-            except TimeoutError:
-                continue
+                # Handshake on the connection's own thread, so one
+                # slow peer does not hold up accepting the next
+                conn.start(wait_for_session=False)
             except Exception as e:
-                if self._running:
-                    self.logger.error(f"Accept error: {e}")
+                self.logger.error("Failed to start connection from %s: %s", addr, e)
+                client_sock.close()
 
     def connect(self, host: str, port: int = 4556) -> TCPCLConnection:
         """Establish outgoing connection to a peer."""
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        _tune_socket(sock)
         sock.connect((host, port))
 
         conn = TCPCLConnection(
             sock=sock,
             local_eid=self.local_eid,
             on_bundle_received=self._on_bundle_received,
+            recv_buffer_size=self.recv_buffer_size,
+            sess_init=self._sess_init,
         )
         conn.start()
 
         # Store connection by peer EID
         if conn.remote_eid:
-            self._connections[str(conn.remote_eid)] = conn
+            self._connections[conn.remote_eid] = conn
 
         return conn
 
@@ -525,15 +1087,13 @@ class TCPConvergenceLayer:
 
         Returns True if sent, False if no route.
         """
-        dest = str(bundle.destination)
-
         # Find connection to destination (or next hop)
-        conn = self._connections.get(dest)
+        conn = self._connections.get(bundle.destination)
         if conn:
             conn.send_bundle(bundle)
             return True
 
-        self.logger.warning(f"No route to {dest}")
+        self.logger.warning("No route to %s", bundle.destination)
         return False
 
     def _on_bundle_received(self, bundle: Bundle) -> None:
@@ -542,4 +1102,4 @@ class TCPConvergenceLayer:
             try:
                 handler(bundle)
             except Exception as e:
-                self.logger.error(f"Bundle handler error: {e}")
+                self.logger.error("Bundle handler error: %s", e)
@@ -16,12 +16,14 @@ Standards:
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import IntEnum, IntFlag
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..core.eid import EndpointID
 
-from ..encoding.cbor import cbor_encode
+from ..encoding.cbor import CBOREncoder, cbor_encode
+from ..encoding.crc import crc16_x25, crc32c, replace_crc_in_block
 
 
 class BlockType(IntEnum):
@@ -65,7 +67,20 @@ class CRCType(IntEnum):
     CRC32C = 2
 
 
-@dataclass
+# Decoded field values to enum members; a dict lookup is an order of
+# magnitude cheaper than calling the enum class once per decoded block
+_CRC_TYPES = {crc_type.value: crc_type for crc_type in CRCType}
+
+
+# Bounded: flag values come from received bundles and IntFlag accepts
+# any integer, so an unbounded cache could be grown without limit
+@lru_cache(maxsize=64)
+def _decode_block_flags(value: int) -> BlockProcessingFlags:
+    """Return the BlockProcessingFlags member for a decoded value."""
+    return BlockProcessingFlags(value)
+
+
+@dataclass(slots=True)
 class CanonicalBlock(ABC):
     """
     Abstract base for all canonical (non-primary) blocks.
@@ -128,8 +143,19 @@ class CanonicalBlock(ABC):
 
         return cbor_encode(arr)
 
+    def encode_with_crc(self) -> bytes:
+        """Encode block with its CRC value filled in."""
+        return replace_crc_in_block(self.encode_for_crc(), int(self.crc_type))
+
+
+# CRC type to (encoded zero CRC field, CRC function)
+_CRC_FIELDS = {
+    CRCType.CRC16: (b'\x42\x00\x00', crc16_x25),
+    CRCType.CRC32C: (b'\x44\x00\x00\x00\x00', crc32c),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class PayloadBlock(CanonicalBlock):
     """
     Bundle Payload Block per RFC 9171 Section 4.3.3.
@@ -144,12 +170,10 @@ class PayloadBlock(CanonicalBlock):
     Attributes:
         data: The application data (payload bytes)
     """
+    # Payload block always has block number 1
+    block_number: int = field(init=False, default=1)
     data: bytes = field(default_factory=bytes)
 
-    def __post_init__(self):
-        # Payload block always has block number 1
-        object.__setattr__(self, 'block_number', 1)
-
     @property
     def block_type(self) -> BlockType:
         return BlockType.PAYLOAD
@@ -158,6 +182,49 @@ class PayloadBlock(CanonicalBlock):
         """Return payload data."""
         return self.data
 
+    def encode_head(self, crc_placeholder: bool = False) -> bytes:
+        """
+        Encode the block up to, but not including, the payload bytes.
+
+        The block's CBOR encoding is this head followed by self.data
+        (and the CRC field, if crc_placeholder), so callers can emit the
+        payload without copying it through the CBOR encoder.
+
+        Args:
+            crc_placeholder: Count a trailing CRC field in the array length
+        """
+        encoder = CBOREncoder()
+        has_crc = crc_placeholder and self.crc_type != CRCType.NONE
+        encoder.encode_array_header(6 if has_crc else 5)
+        encoder.encode_unsigned_int(int(self.block_type))
+        encoder.encode_unsigned_int(self.block_number)
+        encoder.encode_unsigned_int(int(self.flags))
+        encoder.encode_unsigned_int(int(self.crc_type))
+        encoder.encode_bytes_header(len(self.data))
+        return encoder.get_bytes()
+
+    def encode_for_crc(self) -> bytes:
+        """Encode block with zero CRC for CRC calculation."""
+        crc_field = _CRC_FIELDS[self.crc_type][0] if self.crc_type in _CRC_FIELDS else b''
+        return b''.join((self.encode_head(crc_placeholder=True), self.data, crc_field))
+
+    def encode_with_crc(self) -> bytes:
+        """
+        Encode block with its CRC value filled in.
+
+        The CRC is computed piece by piece over the head, the payload and
+        the zeroed CRC field, so the payload is read once by the CRC and
+        copied once into the result, never into an intermediate encoding.
+        """
+        if self.crc_type not in _CRC_FIELDS:
+            return self.encode_for_crc()
+
+        zero_field, crc_func = _CRC_FIELDS[self.crc_type]
+        head = self.encode_head(crc_placeholder=True)
+        crc = crc_func(zero_field, crc_func(self.data, crc_func(head)))
+        crc_len = len(zero_field) - 1
+        return b''.join((head, self.data, zero_field[:1], crc.to_bytes(crc_len, 'big')))
+
     @classmethod
     def from_cbor_array(cls, arr: list[Any]) -> 'PayloadBlock':
         """Create PayloadBlock from decoded CBOR array."""
@@ -172,15 +239,16 @@ class PayloadBlock(CanonicalBlock):
         if block_number != 1:
             raise ValueError(f"Payload block number must be 1, got {block_number}")
 
-        flags = BlockProcessingFlags(arr[2])
-        crc_type = CRCType(arr[3])
+        flags = _decode_block_flags(arr[2])
+        crc_type = _CRC_TYPES.get(arr[3])
+        if crc_type is None:
+            raise ValueError(f"Unknown CRC type: {arr[3]}")
         data = arr[4]
 
         if not isinstance(data, bytes):
             raise ValueError(f"Payload data must be bytes, got {type(data)}")
 
         return cls(
-            block_number=1,
             flags=flags,
             crc_type=crc_type,
             data=data,
@@ -200,7 +268,7 @@ def _default_endpoint_id():
     return EndpointID.none()
 
 
-@dataclass
+@dataclass(slots=True)
 class PreviousNodeBlock(CanonicalBlock):
     """
     Previous Node Block per RFC 9171 Section 4.4.1.
@@ -224,7 +292,7 @@ class PreviousNodeBlock(CanonicalBlock):
         return f"PreviousNodeBlock({self.previous_node})"
 
 
-@dataclass
+@dataclass(slots=True)
 class BundleAgeBlock(CanonicalBlock):
     """
     Bundle Age Block per RFC 9171 Section 4.4.2.
@@ -248,7 +316,7 @@ class BundleAgeBlock(CanonicalBlock):
         return f"BundleAgeBlock({self.age_microseconds} µs)"
 
 
-@dataclass
+@dataclass(slots=True)
 class HopCountBlock(CanonicalBlock):
     """
     Hop Count Block per RFC 9171 Section 4.4.3.
@@ -12,13 +12,15 @@ Standards:
 - CCSDS 734.20-O-1 Section 4.3.1
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntFlag
+from functools import lru_cache
 from typing import Any
 
-from ..core.eid import EndpointID
+from ..core.eid import EID_CACHE_SIZE, EndpointID
 from ..core.time import CreationTimestamp, DTNTime
-from ..encoding.cbor import cbor_encode
+from ..encoding.cbor import CBOREncoder, cbor_encode
+from ..encoding.crc import crc16_x25, crc32c
 
 
 class BundleProcessingFlags(IntFlag):
@@ -66,7 +68,25 @@ class CRCType(IntFlag):
     CRC32C = 2    # CRC-32C (Castagnoli)
 
 
-@dataclass
+# Flag bits as plain ints; IntFlag operators build a new flag member
+# on every test
+_IS_FRAGMENT = BundleProcessingFlags.IS_FRAGMENT.value
+_IS_ADMIN_RECORD = BundleProcessingFlags.IS_ADMIN_RECORD.value
+
+# CRC type to (encoded zero CRC field, CRC function)
+_CRC_FIELDS = {
+    CRCType.CRC16: (b'\x42\x00\x00', crc16_x25),
+    CRCType.CRC32C: (b'\x44\x00\x00\x00\x00', crc32c),
+}
+
+
+@lru_cache(maxsize=EID_CACHE_SIZE)
+def _encode_eid(eid: EndpointID) -> bytes:
+    """Return the CBOR encoding of an EID; a node sees the same few often."""
+    return cbor_encode(eid.to_cbor_value())
+
+
+@dataclass(slots=True)
 class PrimaryBlock:
     """
     Bundle Primary Block per RFC 9171 Section 4.3.1.
@@ -105,11 +125,25 @@ class PrimaryBlock:
     fragment_offset: int | None = None
     total_adu_length: int | None = None
 
+    # int(flags) for the flag tests, and the flags value it was taken
+    # from; see _flag_bits()
+    _flags_int: int = field(default=0, init=False, repr=False, compare=False)
+    _flags_from: Any = field(default=None, init=False, repr=False, compare=False)
+    # (field values, encoded fields [0]-[9]) and (source, timestamp,
+    # fragment offset, bundle_id); reused while the values are unchanged.
+    # Field values (EIDs, timestamps) are immutable, so reassignment is
+    # the only way either can go stale.
+    _encoded_fields: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _bundle_id: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
     VERSION = 7  # Bundle Protocol Version 7
 
     def __post_init__(self):
+        self._flags_from = self.flags
+        self._flags_int = int(self.flags)
+
         # Validate fragmentation fields
-        is_fragment = bool(self.flags & BundleProcessingFlags.IS_FRAGMENT)
+        is_fragment = self.is_fragment
         has_frag_fields = (self.fragment_offset is not None or
                           self.total_adu_length is not None)
 
@@ -129,15 +163,43 @@ class PrimaryBlock:
         if self.lifetime_ms < 0:
             raise ValueError("Lifetime cannot be negative")
 
+    def _flag_bits(self) -> int:
+        """int(flags), converted again only after flags is reassigned."""
+        flags = self.flags
+        if flags is not self._flags_from:
+            self._flags_from = flags
+            self._flags_int = int(flags)
+        return self._flags_int
+
     @property
     def is_fragment(self) -> bool:
         """Check if this bundle is a fragment."""
-        return bool(self.flags & BundleProcessingFlags.IS_FRAGMENT)
+        return bool(self._flag_bits() & _IS_FRAGMENT)
 
     @property
     def is_admin_record(self) -> bool:
         """Check if this bundle contains an administrative record."""
-        return bool(self.flags & BundleProcessingFlags.IS_ADMIN_RECORD)
+        return bool(self._flag_bits() & _IS_ADMIN_RECORD)
+
+    @property
+    def bundle_id(self) -> str:
+        """
+        Identifier of the bundle this block heads.
+
+        source-eid/creation-time/sequence, plus /fragment-offset for
+        fragments. Built once and kept while those fields are unchanged.
+        """
+        key = (self.source, self.creation_timestamp, self._flag_bits(), self.fragment_offset)
+        cached = self._bundle_id
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        timestamp = self.creation_timestamp
+        bundle_id = f"{self.source}/{timestamp.time.milliseconds}/{timestamp.sequence_number}"
+        if self.is_fragment:
+            bundle_id = f"{bundle_id}/{self.fragment_offset}"
+        self._bundle_id = (key, bundle_id)
+        return bundle_id
 
     @property
     def expiration_time(self) -> DTNTime | None:
@@ -182,10 +244,10 @@ class PrimaryBlock:
             self.VERSION,
             int(self.flags),
             int(self.crc_type),
-            list(self.destination.to_cbor_value()),
-            list(self.source.to_cbor_value()),
-            list(self.report_to.to_cbor_value()),
-            list(self.creation_timestamp.to_cbor_array()),
+            self.destination.to_cbor_value(),
+            self.source.to_cbor_value(),
+            self.report_to.to_cbor_value(),
+            self.creation_timestamp.to_cbor_array(),
             self.lifetime_ms,
         ]
 
@@ -200,6 +262,68 @@ class PrimaryBlock:
 
         return arr
 
+    def _encode_fields(self) -> bytes:
+        """
+        Encode fields [0]-[9] back to back, without the array head.
+
+        Written straight to CBOR rather than through to_cbor_array(),
+        with EID encodings shared between blocks.
+        """
+        encoder = CBOREncoder()
+        encoder.encode_unsigned_int(self.VERSION)
+        encoder.encode_unsigned_int(int(self.flags))
+        encoder.encode_unsigned_int(int(self.crc_type))
+        head = encoder.get_bytes()
+
+        encoder.reset()
+        encoder.encode(self.creation_timestamp.to_cbor_array())
+        encoder.encode_unsigned_int(self.lifetime_ms)
+        if self.is_fragment:
+            encoder.encode_unsigned_int(self.fragment_offset)
+            encoder.encode_unsigned_int(self.total_adu_length)
+
+        return b''.join((
+            head,
+            _encode_eid(self.destination),
+            _encode_eid(self.source),
+            _encode_eid(self.report_to),
+            encoder.get_bytes(),
+        ))
+
+    def _array_head_and_fields(self, has_crc: bool) -> tuple[bytes, bytes]:
+        """Return the array head and the (cached) encoded fields [0]-[9]."""
+        key = (
+            self.flags, self.crc_type, self.destination, self.source, self.report_to,
+            self.creation_timestamp, self.lifetime_ms, self.fragment_offset,
+            self.total_adu_length,
+        )
+        cached = self._encoded_fields
+        if cached is not None and cached[0] == key:
+            fields = cached[1]
+        else:
+            fields = self._encode_fields()
+            self._encoded_fields = (key, fields)
+
+        # At most 11 items, so the array head is a single byte
+        length = (10 if self.is_fragment else 8) + (1 if has_crc else 0)
+        return bytes((0x80 | length,)), fields
+
+    def encode(self, crc_placeholder: bool = False) -> bytes:
+        """
+        Encode block to CBOR bytes.
+
+        The encoded fields are kept while the field values are unchanged,
+        so repeated encodings of the same block reuse them.
+
+        Args:
+            crc_placeholder: Append a zero-filled CRC field (if CRC type != 0)
+        """
+        # CRCType.NONE has no CRC field
+        crc_field = _CRC_FIELDS[self.crc_type][0] if (
+            crc_placeholder and self.crc_type in _CRC_FIELDS) else b''
+        head, fields = self._array_head_and_fields(bool(crc_field))
+        return b''.join((head, fields, crc_field))
+
     def encode_for_crc(self) -> bytes:
         """
         Encode block with zero CRC for CRC calculation.
@@ -207,16 +331,24 @@ class PrimaryBlock:
         The CRC is calculated over the block with the CRC field
         containing zeros, then the actual CRC replaces the zeros.
         """
-        arr = self.to_cbor_array()
+        return self.encode(crc_placeholder=True)
 
-        # Add CRC placeholder
-        if self.crc_type == CRCType.CRC16:
-            arr.append(b'\x00\x00')  # 2 bytes
-        elif self.crc_type == CRCType.CRC32C:
-            arr.append(b'\x00\x00\x00\x00')  # 4 bytes
-        # CRCType.NONE - no CRC field
+    def encode_with_crc(self) -> bytes:
+        """
+        Encode block with its CRC value filled in.
+
+        The CRC is run over the pieces as they are assembled, ending
+        with the zeroed CRC field, so the block is joined once with the
+        CRC in place instead of being encoded with zeros and patched.
+        """
+        if self.crc_type not in _CRC_FIELDS:
+            return self.encode()
 
-        return cbor_encode(arr)
+        zero_field, crc_func = _CRC_FIELDS[self.crc_type]
+        head, fields = self._array_head_and_fields(True)
+        crc = crc_func(zero_field, crc_func(fields, crc_func(head)))
+        crc_len = len(zero_field) - 1
+        return b''.join((head, fields, zero_field[:1], crc.to_bytes(crc_len, 'big')))
 
     @classmethod
     def from_cbor_array(cls, arr: list[Any]) -> 'PrimaryBlock':
@@ -247,7 +379,7 @@ class PrimaryBlock:
         # Fragment fields
         fragment_offset = None
         total_adu_length = None
-        if flags & BundleProcessingFlags.IS_FRAGMENT:
+        if arr[1] & _IS_FRAGMENT:
             if len(arr) < 10:
                 raise ValueError("Fragment flag set but fragment fields missing")
             fragment_offset = arr[8]
@@ -24,7 +24,7 @@ from .eid import EndpointID
 from .time import CreationTimestamp, DTNTime
 
 
-@dataclass
+@dataclass(slots=True)
 class Bundle:
     """
     Bundle Protocol Version 7 Bundle.
@@ -55,12 +55,16 @@ class Bundle:
         if self.payload.block_number != 1:
             raise ValueError("Payload block must have block number 1")
 
-        # Validate extension block numbers
-        used_numbers = {0, 1}  # Reserved for primary and payload
-        for ext in self.extensions:
-            if ext.block_number in used_numbers:
-                raise ValueError(f"Duplicate block number: {ext.block_number}")
-            used_numbers.add(ext.block_number)
+        # Validate extension block numbers; 0 and 1 are reserved for the
+        # primary and payload blocks. The loop only runs to name the
+        # offending number once the set comparison has found one.
+        numbers = [ext.block_number for ext in self.extensions]
+        if numbers and (len(set(numbers)) != len(numbers) or 0 in numbers or 1 in numbers):
+            used_numbers = {0, 1}
+            for number in numbers:
+                if number in used_numbers:
+                    raise ValueError(f"Duplicate block number: {number}")
+                used_numbers.add(number)
 
     @classmethod
     def create(
@@ -99,10 +103,7 @@ class Bundle:
             crc_type=CRCType.CRC16,
         )
 
-        payload_block = PayloadBlock(
-            block_number=1,
-            data=payload,
-        )
+        payload_block = PayloadBlock(data=payload)
 
         return cls(primary=primary, payload=payload_block)
 
@@ -148,6 +149,8 @@ class Bundle:
         if block_type == BlockType.PAYLOAD:
             return self.payload
 
+        # Bundles carry a handful of extensions at most, so a scan is as
+        # fast as an index and cannot go stale when the list is edited
         for ext in self.extensions:
             if ext.block_type == block_type:
                 return ext
@@ -190,33 +193,35 @@ class Bundle:
         Returns:
             CBOR-encoded bundle as indefinite-length array
         """
-        encoder = CBOREncoder()
-
-        # Start indefinite-length array
-        encoder.encode_indefinite_array_start()
-
-        # Encode primary block
-        encoder.encode(self.primary.to_cbor_array())
-
-        # Encode payload block
-        encoder.encode(self.payload.to_cbor_array())
-
-        # Encode extension blocks
-        for ext in self.extensions:
-            encoder.encode(ext.to_cbor_array())
-
-        # End indefinite-length array
-        encoder.encode_break()
-
-        return encoder.get_bytes()
+        # Extension blocks and the closing break share one encoder; most
+        # bundles have no extensions and need no encoder at all
+        if self.extensions:
+            encoder = CBOREncoder()
+            for ext in self.extensions:
+                encoder.encode(ext.to_cbor_array())
+            encoder.encode_break()
+            tail = encoder.get_bytes()
+        else:
+            tail = b'\xff'
+
+        # Indefinite-length array start, primary block and payload block
+        # head; the payload bytes are joined in as they are, so they are
+        # copied once, straight into the result
+        return b''.join((
+            b'\x9f',
+            self.primary.encode(),
+            self.payload.encode_head(),
+            self.payload.data,
+            tail,
+        ))
 
     @classmethod
-    def decode(cls, data: bytes) -> 'Bundle':
+    def decode(cls, data: bytes | bytearray) -> 'Bundle':
         """
         Decode bundle from CBOR bytes.
 
         Args:
-            data: CBOR-encoded bundle
+            data: CBOR-encoded bundle; a bytearray is read in place
 
         Returns:
             Decoded Bundle
@@ -254,6 +259,27 @@ class Bundle:
 
         return cls(primary=primary, payload=payload)
 
+    @staticmethod
+    def decode_primary(data: bytes) -> PrimaryBlock:
+        """
+        Decode only the primary block of an encoded bundle.
+
+        Forwarding decisions need nothing else, so the payload and
+        extension blocks are left unparsed.
+
+        Args:
+            data: CBOR-encoded bundle
+
+        Returns:
+            Decoded PrimaryBlock
+
+        Raises:
+            ValueError: If the primary block is invalid
+        """
+        decoder = CBORDecoder(data)
+        decoder.decode_array_start()
+        return PrimaryBlock.from_cbor_array(decoder.decode())
+
     @property
     def bundle_id(self) -> str:
         """
@@ -265,16 +291,7 @@ class Bundle:
         Returns:
             Bundle identifier string
         """
-        parts = [
-            str(self.source),
-            str(self.creation_time.time.milliseconds),
-            str(self.creation_time.sequence_number),
-        ]
-
-        if self.is_fragment:
-            parts.append(str(self.primary.fragment_offset))
-
-        return '/'.join(parts)
+        return self.primary.bundle_id
 
     def __len__(self) -> int:
         """Return payload length."""
@@ -14,9 +14,9 @@ Standards:
 - CCSDS 734.20-O-1 Section 4.2.5
 """
 
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import lru_cache
 
 
 class EIDScheme(IntEnum):
@@ -32,8 +32,12 @@ class EIDScheme(IntEnum):
 # Special well-known EID for null endpoint
 DTN_NONE_SSP = 0  # dtn:none is encoded as [1, 0]
 
+# Distinct EIDs kept by the none()/dtn()/ipn() constructors, which hand
+# out one shared instance per EID
+EID_CACHE_SIZE = 4096
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EndpointID:
     """
     Bundle Protocol Endpoint Identifier.
@@ -47,6 +51,10 @@ class EndpointID:
     - dtn:<uri> -> [1, <text-string>]
     - ipn:<node>.<service> -> [2, [<node>, <service>]]
 
+    The none(), dtn(), ipn(), parse() and from_cbor_value() constructors
+    return a shared instance for recently used EIDs, so bundles and
+    routing tables do not each hold their own copy.
+
     Attributes:
         scheme: The EID scheme (DTN or IPN)
         ssp: Scheme-specific part (varies by scheme)
@@ -54,6 +62,13 @@ class EndpointID:
     scheme: EIDScheme
     ssp: int | str | tuple[int, int]
 
+    # EIDs key routing tables; hash once instead of per lookup
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    # Filled in on first use by __str__ and to_cbor_value
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
+    _cbor_value: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         # Validate SSP based on scheme
         if self.scheme == EIDScheme.DTN:
@@ -70,7 +85,13 @@ class EndpointID:
             if node < 0 or service < 0:
                 raise ValueError("IPN node and service must be non-negative")
 
+        object.__setattr__(self, '_hash', hash((self.scheme, self.ssp)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
     @classmethod
+    @lru_cache(maxsize=1)
     def none(cls) -> 'EndpointID':
         """
         Create the null endpoint (dtn:none).
@@ -94,6 +115,16 @@ class EndpointID:
         Example:
             EndpointID.dtn("//node1/inbox")  # dtn://node1/inbox
         """
+        # Checked before the cache, which would reject unhashable
+        # arguments with a TypeError
+        if not isinstance(uri, str):
+            raise ValueError("DTN URI must be a string")
+        return cls._dtn(uri)
+
+    @classmethod
+    @lru_cache(maxsize=EID_CACHE_SIZE)
+    def _dtn(cls, uri: str) -> 'EndpointID':
+        """Shared dtn() instance for a validated URI string."""
         if not uri:
             raise ValueError("DTN URI cannot be empty (use none() for dtn:none)")
         return cls(scheme=EIDScheme.DTN, ssp=uri)
@@ -113,6 +144,15 @@ class EndpointID:
         Example:
             EndpointID.ipn(1, 0)  # ipn:1.0
         """
+        # As in dtn(): malformed input is a ValueError, not a cache error
+        if not isinstance(node, int) or not isinstance(service, int):
+            raise ValueError("IPN node and service must be integers")
+        return cls._ipn(node, service)
+
+    @classmethod
+    @lru_cache(maxsize=EID_CACHE_SIZE, typed=True)  # ipn(True, 0) must not hit ipn(1, 0)
+    def _ipn(cls, node: int, service: int) -> 'EndpointID':
+        """Shared ipn() instance for validated integer node and service."""
         return cls(scheme=EIDScheme.IPN, ssp=(node, service))
 
     @classmethod
@@ -140,12 +180,11 @@ class EndpointID:
 
         if eid_string.startswith("ipn:"):
             ipn_part = eid_string[4:]  # Remove "ipn:" prefix
-            match = re.match(r'^(\d+)\.(\d+)$', ipn_part)
-            if not match:
+            node, sep, service = ipn_part.partition('.')
+            # isdecimal() accepts exactly the digits int() does
+            if not (sep and node.isdecimal() and service.isdecimal()):
                 raise ValueError(f"Invalid IPN EID format: {eid_string}")
-            node = int(match.group(1))
-            service = int(match.group(2))
-            return cls.ipn(node, service)
+            return cls.ipn(int(node), int(service))
 
         raise ValueError(f"Unknown EID scheme: {eid_string}")
 
@@ -175,13 +214,19 @@ class EndpointID:
             - dtn:none -> (1, 0)
             - dtn:<uri> -> (1, "<uri>")
             - ipn:<n>.<s> -> (2, (n, s))
+
+        The value is computed once and shared by every user of the EID,
+        so it is built from tuples throughout and cannot be modified.
+        Callers that need a mutable array must copy it.
         """
-        if self.scheme == EIDScheme.DTN:
-            if self.ssp == 0:
-                return (1, 0)
-            return (1, self.ssp)
-        else:  # IPN
-            return (2, list(self.ssp))
+        value = self._cbor_value
+        if value is None:
+            if self.scheme == EIDScheme.DTN:
+                value = (1, 0) if self.ssp == 0 else (1, self.ssp)
+            else:  # IPN
+                value = (2, self.ssp)
+            object.__setattr__(self, '_cbor_value', value)
+        return value
 
     @classmethod
     def from_cbor_value(cls, value: tuple) -> 'EndpointID':
@@ -216,13 +261,15 @@ class EndpointID:
 
     def __str__(self) -> str:
         """Return string representation (URI format)."""
-        if self.scheme == EIDScheme.DTN:
-            if self.ssp == 0:
-                return "dtn:none"
-            return f"dtn:{self.ssp}"
-        else:  # IPN
-            node, service = self.ssp
-            return f"ipn:{node}.{service}"
+        text = self._str
+        if text is None:
+            if self.scheme == EIDScheme.DTN:
+                text = "dtn:none" if self.ssp == 0 else f"dtn:{self.ssp}"
+            else:  # IPN
+                node, service = self.ssp
+                text = f"ipn:{node}.{service}"
+            object.__setattr__(self, '_str', text)
+        return text
 
     def __repr__(self) -> str:
         return f"EndpointID({self})"
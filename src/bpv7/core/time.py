@@ -15,12 +15,15 @@ Standards:
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from time import time_ns
 
 # DTN Epoch: 2000-01-01 00:00:00 UTC
 DTN_EPOCH_UNIX = 946684800
+_DTN_EPOCH_NS = DTN_EPOCH_UNIX * 1_000_000_000
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DTNTime:
     """
     DTN Time representation.
@@ -40,9 +43,8 @@ class DTNTime:
     @classmethod
     def now(cls) -> 'DTNTime':
         """Create DTNTime for the current moment."""
-        unix_ms = int(datetime.now(UTC).timestamp() * 1000)
-        dtn_ms = unix_ms - (DTN_EPOCH_UNIX * 1000)
-        return cls(milliseconds=dtn_ms)
+        # Integer nanoseconds; no datetime object or float rounding
+        return cls(milliseconds=(time_ns() - _DTN_EPOCH_NS) // 1_000_000)
 
     @classmethod
     def from_unix(cls, unix_timestamp: float) -> 'DTNTime':
@@ -61,8 +63,9 @@ class DTNTime:
         return cls.from_unix(dt.timestamp())
 
     @classmethod
+    @lru_cache(maxsize=1)
     def unknown(cls) -> 'DTNTime':
-        """Create DTNTime representing unknown/unavailable time."""
+        """Create DTNTime representing unknown/unavailable time (shared instance)."""
         return cls(milliseconds=0)
 
     def to_unix(self) -> float:
@@ -88,7 +91,7 @@ class DTNTime:
         return f"DTNTime({self.to_datetime().isoformat()})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreationTimestamp:
     """
     Bundle Creation Timestamp per RFC 9171 Section 4.2.6.
@@ -117,8 +120,9 @@ class CreationTimestamp:
         return cls(time=DTNTime.now(), sequence_number=sequence_number)
 
     @classmethod
+    @lru_cache(maxsize=1)
     def none(cls) -> 'CreationTimestamp':
-        """Create a null timestamp for anonymous bundles (dtn:none source)."""
+        """Create a null timestamp for anonymous bundles (shared instance)."""
         return cls(time=DTNTime.unknown(), sequence_number=0)
 
     def to_cbor_array(self) -> tuple[int, int]:
@@ -11,6 +11,7 @@ Standards:
 
 import struct
 from enum import IntEnum
+from operator import itemgetter
 from typing import Any
 
 
@@ -42,6 +43,32 @@ AI_FOUR_BYTES = 26
 AI_EIGHT_BYTES = 27
 AI_INDEFINITE = 31
 
+# Major types as plain ints; enum member access costs more than the
+# head encoding itself
+_MT_UNSIGNED_INT = CBORMajorType.UNSIGNED_INT.value
+_MT_NEGATIVE_INT = CBORMajorType.NEGATIVE_INT.value
+_MT_BYTE_STRING = CBORMajorType.BYTE_STRING.value
+_MT_TEXT_STRING = CBORMajorType.TEXT_STRING.value
+_MT_ARRAY = CBORMajorType.ARRAY.value
+_MT_MAP = CBORMajorType.MAP.value
+
+# Complete encodings of the simple values the encoder emits
+_FALSE = (CBORMajorType.SIMPLE << 5) | CBORSimpleValue.FALSE
+_TRUE = (CBORMajorType.SIMPLE << 5) | CBORSimpleValue.TRUE
+_NULL = (CBORMajorType.SIMPLE << 5) | CBORSimpleValue.NULL
+
+# Initial byte + big-endian argument, packed in one call
+_HEAD_UINT16 = struct.Struct('>BH')
+_HEAD_UINT32 = struct.Struct('>BI')
+_HEAD_UINT64 = struct.Struct('>BQ')
+
+# Big-endian argument decoders, keyed by additional info
+_ARGUMENT_STRUCTS = {
+    AI_TWO_BYTES: struct.Struct('>H'),
+    AI_FOUR_BYTES: struct.Struct('>I'),
+    AI_EIGHT_BYTES: struct.Struct('>Q'),
+}
+
 
 class CBOREncoder:
     """
@@ -51,6 +78,8 @@ class CBOREncoder:
     that indefinite-length items are permitted (for bundle arrays).
     """
 
+    __slots__ = ('_buffer',)
+
     def __init__(self):
         self._buffer = bytearray()
 
@@ -68,33 +97,31 @@ class CBOREncoder:
 
         Uses shortest possible encoding (deterministic requirement).
         """
+        buffer = self._buffer
         mt_shifted = major_type << 5
 
         if argument < 24:
             # Argument fits in initial byte
-            self._buffer.append(mt_shifted | argument)
+            buffer.append(mt_shifted | argument)
         elif argument <= 0xFF:
             # One additional byte
-            self._buffer.append(mt_shifted | AI_ONE_BYTE)
-            self._buffer.append(argument)
+            buffer.append(mt_shifted | AI_ONE_BYTE)
+            buffer.append(argument)
         elif argument <= 0xFFFF:
             # Two additional bytes (network byte order)
-            self._buffer.append(mt_shifted | AI_TWO_BYTES)
-            self._buffer.extend(struct.pack('>H', argument))
+            buffer += _HEAD_UINT16.pack(mt_shifted | AI_TWO_BYTES, argument)
         elif argument <= 0xFFFFFFFF:
             # Four additional bytes
-            self._buffer.append(mt_shifted | AI_FOUR_BYTES)
-            self._buffer.extend(struct.pack('>I', argument))
+            buffer += _HEAD_UINT32.pack(mt_shifted | AI_FOUR_BYTES, argument)
         else:
             # Eight additional bytes
-            self._buffer.append(mt_shifted | AI_EIGHT_BYTES)
-            self._buffer.extend(struct.pack('>Q', argument))
+            buffer += _HEAD_UINT64.pack(mt_shifted | AI_EIGHT_BYTES, argument)
 
     def encode_unsigned_int(self, value: int) -> 'CBOREncoder':
         """Encode an unsigned integer (major type 0)."""
         if value < 0:
             raise ValueError("Value must be non-negative for unsigned int")
-        self._encode_head(CBORMajorType.UNSIGNED_INT, value)
+        self._encode_head(_MT_UNSIGNED_INT, value)
         return self
 
     def encode_negative_int(self, value: int) -> 'CBOREncoder':
@@ -102,7 +129,7 @@ class CBOREncoder:
         if value >= 0:
             raise ValueError("Value must be negative")
         # CBOR encodes -1 as 0, -2 as 1, etc.
-        self._encode_head(CBORMajorType.NEGATIVE_INT, -1 - value)
+        self._encode_head(_MT_NEGATIVE_INT, -1 - value)
         return self
 
     def encode_int(self, value: int) -> 'CBOREncoder':
@@ -114,20 +141,30 @@ class CBOREncoder:
 
     def encode_bytes(self, data: bytes) -> 'CBOREncoder':
         """Encode a definite-length byte string (major type 2)."""
-        self._encode_head(CBORMajorType.BYTE_STRING, len(data))
+        self._encode_head(_MT_BYTE_STRING, len(data))
         self._buffer.extend(data)
         return self
 
+    def encode_bytes_header(self, length: int) -> 'CBOREncoder':
+        """
+        Encode only the head of a byte string (major type 2).
+
+        The caller supplies the length bytes separately, so large data
+        need not be copied through the encoder buffer.
+        """
+        self._encode_head(_MT_BYTE_STRING, length)
+        return self
+
     def encode_text(self, text: str) -> 'CBOREncoder':
         """Encode a definite-length text string (major type 3)."""
         utf8_bytes = text.encode('utf-8')
-        self._encode_head(CBORMajorType.TEXT_STRING, len(utf8_bytes))
+        self._encode_head(_MT_TEXT_STRING, len(utf8_bytes))
         self._buffer.extend(utf8_bytes)
         return self
 
     def encode_array_header(self, length: int) -> 'CBOREncoder':
         """Encode a definite-length array header (major type 4)."""
-        self._encode_head(CBORMajorType.ARRAY, length)
+        self._encode_head(_MT_ARRAY, length)
         return self
 
     def encode_indefinite_array_start(self) -> 'CBOREncoder':
@@ -137,7 +174,7 @@ class CBOREncoder:
 
     def encode_map_header(self, length: int) -> 'CBOREncoder':
         """Encode a definite-length map header (major type 5)."""
-        self._encode_head(CBORMajorType.MAP, length)
+        self._encode_head(_MT_MAP, length)
         return self
 
     def encode_break(self) -> 'CBOREncoder':
@@ -147,13 +184,41 @@ class CBOREncoder:
 
     def encode_bool(self, value: bool) -> 'CBOREncoder':
         """Encode a boolean value."""
-        simple = CBORSimpleValue.TRUE if value else CBORSimpleValue.FALSE
-        self._buffer.append((CBORMajorType.SIMPLE << 5) | simple)
+        self._buffer.append(_TRUE if value else _FALSE)
         return self
 
     def encode_null(self) -> 'CBOREncoder':
         """Encode null."""
-        self._buffer.append((CBORMajorType.SIMPLE << 5) | CBORSimpleValue.NULL)
+        self._buffer.append(_NULL)
+        return self
+
+    def _encode_array(self, value: list | tuple) -> 'CBOREncoder':
+        """Encode a list or tuple as a definite-length array."""
+        self._encode_head(_MT_ARRAY, len(value))
+        encode = self.encode
+        for item in value:
+            encode(item)
+        return self
+
+    def _encode_map(self, value: dict) -> 'CBOREncoder':
+        """Encode a dict as a definite-length map."""
+        # Deterministic: sort keys by their encoding. Each key is
+        # encoded once and those bytes are written out as is.
+        self._encode_head(_MT_MAP, len(value))
+        items = sorted(
+            ((cbor_encode(key), item) for key, item in value.items()),
+            key=itemgetter(0),
+        )
+        buffer = self._buffer
+        encode = self.encode
+        for encoded_key, item in items:
+            buffer += encoded_key
+            encode(item)
+        return self
+
+    def _encode_none(self, value: None) -> 'CBOREncoder':
+        """Encode None as null."""
+        self._buffer.append(_NULL)
         return self
 
     def encode(self, value: Any) -> 'CBOREncoder':
@@ -162,38 +227,64 @@ class CBOREncoder:
 
         Supports: int, bytes, str, list, dict, bool, None
         """
-        if value is None:
-            return self.encode_null()
-        elif isinstance(value, bool):
-            return self.encode_bool(value)
-        elif isinstance(value, int):
+        # Small unsigned ints and arrays are most of a bundle; handled
+        # inline, without a further call
+        value_type = type(value)
+        if value_type is int:
+            if 0 <= value < 24:
+                self._buffer.append(value)
+                return self
+            return self.encode_int(value)
+        elif value_type is list or value_type is tuple:
+            self._encode_head(_MT_ARRAY, len(value))
+            encode = self.encode
+            for item in value:
+                encode(item)
+            return self
+
+        # Other exact types by table lookup; subclasses (IntEnum,
+        # IntFlag) and the rest go through isinstance
+        method = _ENCODE_DISPATCH.get(value_type)
+        if method is not None:
+            return method(self, value)
+
+        # bool cannot be subclassed, so it never reaches here
+        if isinstance(value, int):
             return self.encode_int(value)
         elif isinstance(value, bytes):
             return self.encode_bytes(value)
         elif isinstance(value, str):
             return self.encode_text(value)
         elif isinstance(value, (list, tuple)):
-            self.encode_array_header(len(value))
-            for item in value:
-                self.encode(item)
-            return self
+            return self._encode_array(value)
         elif isinstance(value, dict):
-            # Deterministic: sort keys
-            self.encode_map_header(len(value))
-            for key in sorted(value.keys(), key=lambda k: CBOREncoder().encode(k).get_bytes()):
-                self.encode(key)
-                self.encode(value[key])
-            return self
+            return self._encode_map(value)
         else:
             raise TypeError(f"Cannot encode type {type(value)}")
 
 
+# Encoder method per exact value type, for CBOREncoder.encode()
+_ENCODE_DISPATCH = {
+    bool: CBOREncoder.encode_bool,
+    bytes: CBOREncoder.encode_bytes,
+    str: CBOREncoder.encode_text,
+    dict: CBOREncoder._encode_map,
+    type(None): CBOREncoder._encode_none,
+}
+
+
 class CBORDecoder:
     """
     CBOR decoder per RFC 8949.
     """
 
-    def __init__(self, data: bytes):
+    __slots__ = ('_data', '_pos')
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        if type(data) is not bytes:
+            # Read other buffers in place rather than copying them whole;
+            # only the strings decoded out of them are copied
+            data = memoryview(data).cast('B').toreadonly()
         self._data = data
         self._pos = 0
 
@@ -210,71 +301,118 @@ class CBORDecoder:
         self._pos += 1
         return byte
 
-    def _read_bytes(self, n: int) -> bytes:
-        """Read n bytes."""
+    def _read_view(self, n: int) -> bytes | memoryview:
+        """Read n bytes, as a slice of the input (a view unless it is bytes)."""
         if self._pos + n > len(self._data):
             raise ValueError("Unexpected end of CBOR data")
         data = self._data[self._pos:self._pos + n]
         self._pos += n
         return data
 
+    def _read_bytes(self, n: int) -> bytes:
+        """Read n bytes."""
+        # bytes() of a bytes slice returns it as is
+        return bytes(self._read_view(n))
+
     def _decode_argument(self, additional_info: int) -> int:
         """Decode the argument based on additional info."""
         if additional_info < 24:
             return additional_info
         elif additional_info == AI_ONE_BYTE:
             return self._read_byte()
-        elif additional_info == AI_TWO_BYTES:
-            return struct.unpack('>H', self._read_bytes(2))[0]
-        elif additional_info == AI_FOUR_BYTES:
-            return struct.unpack('>I', self._read_bytes(4))[0]
-        elif additional_info == AI_EIGHT_BYTES:
-            return struct.unpack('>Q', self._read_bytes(8))[0]
+        elif additional_info in _ARGUMENT_STRUCTS:
+            # Unpacked in place, without slicing the argument out first
+            fmt = _ARGUMENT_STRUCTS[additional_info]
+            pos = self._pos
+            if pos + fmt.size > len(self._data):
+                raise ValueError("Unexpected end of CBOR data")
+            self._pos = pos + fmt.size
+            return fmt.unpack_from(self._data, pos)[0]
         elif additional_info == AI_INDEFINITE:
             return -1  # Indicates indefinite length
         else:
             raise ValueError(f"Invalid additional info: {additional_info}")
 
+    def _decode_array_items(self, length: int) -> list[Any]:
+        """
+        Decode the items of a definite-length array.
+
+        Block headers are runs of small unsigned integers (type, number,
+        flags, CRC type); each of those is a single byte equal to its
+        value and is taken directly instead of through decode().
+        """
+        data = self._data
+        end = len(data)
+        items = []
+        for _ in range(length):
+            pos = self._pos
+            if pos < end and data[pos] < 24:
+                items.append(data[pos])
+                self._pos = pos + 1
+            else:
+                items.append(self.decode())
+        return items
+
+    def decode_array_start(self) -> int:
+        """
+        Read an array head, leaving its items to be decoded one by one.
+
+        Returns:
+            Number of items, or -1 for an indefinite-length array
+        """
+        initial_byte = self._read_byte()
+        if initial_byte >> 5 != _MT_ARRAY:
+            raise ValueError("Expected CBOR array")
+        return self._decode_argument(initial_byte & 0x1F)
+
     def decode(self) -> Any:
         """Decode the next CBOR data item."""
         initial_byte = self._read_byte()
         major_type = initial_byte >> 5
         additional_info = initial_byte & 0x1F
 
+        # Most heads in a bundle carry their argument in the initial byte
+        if major_type == CBORMajorType.SIMPLE:
+            argument = 0
+        elif additional_info < 24:
+            argument = additional_info
+        else:
+            argument = self._decode_argument(additional_info)
+
         if major_type == CBORMajorType.UNSIGNED_INT:
-            return self._decode_argument(additional_info)
+            return argument
 
         elif major_type == CBORMajorType.NEGATIVE_INT:
-            return -1 - self._decode_argument(additional_info)
+            return -1 - argument
 
         elif major_type == CBORMajorType.BYTE_STRING:
-            length = self._decode_argument(additional_info)
-            if length < 0:
+            if argument < 0:
                 raise ValueError("Indefinite byte strings not supported")
-            return self._read_bytes(length)
+            return self._read_bytes(argument)
 
         elif major_type == CBORMajorType.TEXT_STRING:
-            length = self._decode_argument(additional_info)
-            if length < 0:
+            if argument < 0:
                 raise ValueError("Indefinite text strings not supported")
-            return self._read_bytes(length).decode('utf-8')
+            return str(self._read_view(argument), 'utf-8')
 
         elif major_type == CBORMajorType.ARRAY:
-            length = self._decode_argument(additional_info)
-            if length < 0:
-                # Indefinite-length array
+            if argument < 0:
+                # Indefinite-length array, items up to the break code
+                data = self._data
+                end = len(data)
                 items = []
-                while True:
-                    if self._data[self._pos] == 0xFF:  # break code
-                        self._pos += 1
-                        break
-                    items.append(self.decode())
+                append = items.append
+                decode = self.decode
+                while self._pos < end and data[self._pos] != 0xFF:
+                    append(decode())
+                if self._pos >= end:
+                    raise ValueError("Unexpected end of CBOR data")
+                self._pos += 1
                 return items
-            else:
-                return [self.decode() for _ in range(length)]
+            return self._decode_array_items(argument)
 
         elif major_type == CBORMajorType.MAP:
-            length = self._decode_argument(additional_info)
+            length = argument
             if length < 0:
                 raise ValueError("Indefinite maps not supported")
             result = {}
@@ -21,6 +21,7 @@ Example:
 """
 
 import argparse
+import bisect
 import hashlib
 import os
 import random
@@ -28,9 +29,11 @@ import signal
 import sys
 import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from typing import Any
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -42,6 +45,9 @@ from bpv7.agent.tcpcl import TCPConvergenceLayer
 DEFAULT_DURATION_HOURS = 5
 DEFAULT_DATA_RATE_BPS = 160  # Voyager downlink rate
 PORT = 4557  # Different port to avoid conflicts
+SEND_BATCH_SEC = 1.0  # Link time covered by one batch of segments
+DRAIN_TIMEOUT_SEC = 30  # Wait for the receiver before closing the connection
+RATE_LIMIT_SLACK_SEC = 0.01  # Link time a sender may run ahead before sleeping
 
 
 class LinkState(Enum):
@@ -50,6 +56,12 @@ class LinkState(Enum):
     LOS = "LOS"  # Loss of Signal
 
 
+# Members as module globals; looking one up on the Enum class costs
+# several times the identity test it is used for
+_AOS = LinkState.AOS
+_LOS = LinkState.LOS
+
+
 @dataclass
 class ContactWindow:
     """Represents a ground station contact window."""
@@ -61,6 +73,11 @@ class ContactWindow:
         return f"{self.station}: +{self.start_offset_sec}s for {self.duration_sec}s"
 
 
+def _new_hasher():
+    """Payload digest: BLAKE2b-128, faster than MD5 and as long."""
+    return hashlib.blake2b(digest_size=16)
+
+
 @dataclass
 class TransferStats:
     """Statistics for the ongoing transfer."""
@@ -72,6 +89,17 @@ class TransferStats:
     los_events: int = 0
     aos_events: int = 0
     start_time: datetime | None = None
+    # Digests of the data as it is sent and received, so the summary can
+    # check integrity without hashing the whole payload again
+    send_hasher: Any = field(default_factory=_new_hasher, repr=False, compare=False)
+    recv_hasher: Any = field(default_factory=_new_hasher, repr=False, compare=False)
+    # time.monotonic() at start(), for elapsed_sec
+    _start_mono: float | None = field(default=None, repr=False)
+
+    def start(self) -> None:
+        """Mark the start of the transfer."""
+        self.start_time = datetime.now()
+        self._start_mono = time.monotonic()
 
     @property
     def progress_pct(self) -> float:
@@ -81,33 +109,83 @@ class TransferStats:
 
     @property
     def elapsed_sec(self) -> float:
-        if not self.start_time:
+        if self._start_mono is None:
             return 0.0
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.monotonic() - self._start_mono
 
 
-def generate_test_payload(size_bytes: int) -> bytes:
-    """Generate deterministic test payload for verification."""
-    # Use repeating pattern with embedded checksums for verification
-    chunk_size = 1024
-    chunks = []
-    remaining = size_bytes
-    chunk_num = 0
-
-    while remaining > 0:
-        # Create chunk with identifiable pattern
+# (epoch second, "HH:MM:SS") last formatted by _wall_clock()
+_wall_clock_cache: tuple[int, str] = (-1, "")
+
+
+def _wall_clock() -> str:
+    """Local time as HH:MM:SS, formatted at most once per second."""
+    global _wall_clock_cache
+    now = int(time.time())
+    if now != _wall_clock_cache[0]:
+        _wall_clock_cache = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+    return _wall_clock_cache[1]
+
+
+# Byte ramp 0..255 repeated; any (start + i) % 256 run of up to one
+# chunk is a slice of it
+_PATTERN_RAMP = bytes(range(256)) * 5
+
+
+class TestPayload:
+    """
+    Deterministic test payload, generated on demand.
+
+    The payload is a run of 1024-byte chunks, each a CHUNKnnnnnnnn
+    header followed by bytes (chunk_num + i) % 256. Every byte is a
+    function of its offset, so a slice is built from the chunks it
+    covers and the whole payload is never held in memory.
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    CHUNK_SIZE = 1024
+
+    def __init__(self, size_bytes: int):
+        self._size = size_bytes
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _chunk(chunk_num: int) -> bytes:
+        """Full chunk chunk_num, sliced from the ramp after its header."""
         header = f"CHUNK{chunk_num:08d}".encode()
-        pattern = bytes([(chunk_num + i) % 256 for i in range(min(chunk_size - len(header), remaining - len(header)))])
-        chunk = header + pattern
-        chunk = chunk[:min(len(chunk), remaining)]
-        chunks.append(chunk)
-        remaining -= len(chunk)
-        chunk_num += 1
+        start = chunk_num % 256
+        return header + _PATTERN_RAMP[start:start + TestPayload.CHUNK_SIZE - len(header)]
+
+    def __getitem__(self, key: slice) -> bytes:
+        if not isinstance(key, slice):
+            raise TypeError("TestPayload supports slicing only")
+        start, stop, step = key.indices(self._size)
+        if step != 1:
+            raise ValueError("TestPayload slices must be contiguous")
+        if start >= stop:
+            return b''
+
+        chunk_size = self.CHUNK_SIZE
+        first, last = start // chunk_size, (stop - 1) // chunk_size
+        data = b''.join(self._chunk(n) for n in range(first, last + 1))
+        offset = first * chunk_size
+        return data[start - offset:stop - offset]
+
+    def blocks(self, block_size: int = 1 << 20) -> Iterator[bytes]:
+        """Yield the payload in order, block_size bytes at a time."""
+        for start in range(0, self._size, block_size):
+            yield self[start:start + block_size]
 
-    return b''.join(chunks)
 
+def generate_test_payload(size_bytes: int) -> bytes:
+    """Generate deterministic test payload for verification."""
+    return TestPayload(size_bytes)[:]
 
-def create_contact_plan(duration_hours: float) -> list[ContactWindow]:
+
+def create_contact_plan(duration_hours: float, seed: int | None = None) -> list[ContactWindow]:
     """
     Create a realistic contact plan simulating DSN ground station passes.
 
@@ -116,7 +194,10 @@ def create_contact_plan(duration_hours: float) -> list[ContactWindow]:
     - ~8-12 hour coverage from each complex
     - Some overlap, some gaps
     - Voyager 2 constraint: Only Canberra can see it (southern trajectory)
+
+    A seed gives the same plan on every run.
     """
+    rng = random.Random(seed)
     total_sec = int(duration_hours * 3600)
     contacts = []
 
@@ -127,7 +208,7 @@ def create_contact_plan(duration_hours: float) -> list[ContactWindow]:
 
     while current_time < total_sec:
         # Contact window: 60-90 minutes
-        contact_duration = random.randint(3600, 5400)
+        contact_duration = rng.randint(3600, 5400)
 
         # Ensure we don't exceed test duration
         if current_time + contact_duration > total_sec:
@@ -141,7 +222,7 @@ def create_contact_plan(duration_hours: float) -> list[ContactWindow]:
             ))
 
         # Gap: 15-45 minutes (LOS period)
-        gap = random.randint(900, 2700)
+        gap = rng.randint(900, 2700)
         current_time += contact_duration + gap
         station_idx += 1
 
@@ -163,10 +244,31 @@ class SpaceLinkSimulator:
         self.stats = stats
         self.current_state = LinkState.LOS
         self.start_time: datetime | None = None
+        self._start_ns: int | None = None
+        # (state, monotonic ns until which it holds); see get_state()
+        self._state_cache: tuple[LinkState, float] = (_LOS, 0)
         self._stop = threading.Event()
+        # Token bucket for rate_limit_send(): bytes of link time in hand
+        # (negative when sends are ahead of the link) as of _bucket_mono
+        self._bucket = 0.0
+        self._bucket_mono = time.monotonic()
+
+        # Contact windows as sorted, disjoint [start, end) intervals, so
+        # get_state() can bisect instead of scanning the plan every tick
+        self._window_starts: list[int] = []
+        self._window_ends: list[int] = []
+        for contact in sorted(contact_plan, key=lambda c: c.start_offset_sec):
+            start = contact.start_offset_sec
+            end = start + contact.duration_sec
+            if self._window_ends and start <= self._window_ends[-1]:
+                self._window_ends[-1] = max(self._window_ends[-1], end)
+            elif end > start:
+                self._window_starts.append(start)
+                self._window_ends.append(end)
 
     def start(self):
         self.start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
         self._state_thread = threading.Thread(target=self._state_monitor, daemon=True)
         self._state_thread.start()
 
@@ -174,44 +276,85 @@ class SpaceLinkSimulator:
         self._stop.set()
 
     def get_state(self) -> LinkState:
-        """Get current link state based on contact plan."""
-        if not self.start_time:
-            return LinkState.LOS
+        """
+        Get current link state based on contact plan.
+
+        The state cannot change before the next window edge, so it is
+        cached until then and most calls are one clock read.
+        """
+        if self._start_ns is None:
+            return _LOS
 
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        now_ns = time.monotonic_ns()
+        state, valid_until_ns = self._state_cache
+        if now_ns < valid_until_ns:
+            return state
 
-        for contact in self.contact_plan:
-            if contact.start_offset_sec <= elapsed < (contact.start_offset_sec + contact.duration_sec):
-                return LinkState.AOS
+        elapsed = (now_ns - self._start_ns) / 1e9
+
+        # Last window starting at or before now
+        index = bisect.bisect_right(self._window_starts, elapsed) - 1
+        if index >= 0 and elapsed < self._window_ends[index]:
+            state = _AOS
+            next_edge = self._window_ends[index]
+        else:
+            state = _LOS
+            next_edge = (self._window_starts[index + 1]
+                         if index + 1 < len(self._window_starts) else None)
 
-        return LinkState.LOS
+        if next_edge is None:
+            valid_until_ns = float('inf')
+        else:
+            valid_until_ns = self._start_ns + int(next_edge * 1_000_000_000)
+        self._state_cache = (state, valid_until_ns)
+        return state
 
     def _state_monitor(self):
-        """Monitor and log state changes."""
+        """Monitor and log state changes, waking only at window edges."""
         last_state = None
         while not self._stop.is_set():
             current = self.get_state()
-            if current != last_state:
-                if current == LinkState.AOS:
+            if current is not last_state:
+                if current is _AOS:
                     self.stats.aos_events += 1
-                    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] === AOS === Signal acquired")
+                    print(f"\n[{_wall_clock()}] === AOS === Signal acquired")
                 else:
                     self.stats.los_events += 1
-                    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] === LOS === Signal lost - storing data")
+                    print(f"\n[{_wall_clock()}] === LOS === Signal lost - storing data")
                 last_state = current
-            time.sleep(1)
 
-    def rate_limit_send(self, data: bytes) -> bool:
+            # get_state() cached the state until the next window edge;
+            # sleep until then (or until stopped after the last one)
+            valid_until_ns = self._state_cache[1]
+            if valid_until_ns == float('inf'):
+                self._stop.wait()
+            else:
+                self._stop.wait(max(0.0, (valid_until_ns - time.monotonic_ns()) / 1e9))
+
+    def rate_limit_send(self, data_len: int) -> bool:
         """
-        Simulate bandwidth-limited send.
+        Simulate bandwidth-limited send of data_len bytes.
         Returns True if link is up, False if LOS.
+
+        Sends draw on a token bucket refilled at the link rate, and the
+        caller only sleeps once it is RATE_LIMIT_SLACK_SEC ahead, so many
+        small sends cost one sleep instead of one each.
         """
-        if self.get_state() == LinkState.LOS:
+        if self.get_state() is _LOS:
             return False
 
-        # Simulate transmission time
-        tx_time = len(data) / self.bytes_per_sec
-        time.sleep(tx_time)
+        rate = self.bytes_per_sec
+        slack = rate * RATE_LIMIT_SLACK_SEC
+        now = time.monotonic()
+        # Idle time only banks up to the slack, so a sender cannot burst
+        # far past the link rate after a pause
+        bucket = min(self._bucket + (now - self._bucket_mono) * rate, slack) - data_len
+        if bucket < -slack:
+            time.sleep(-bucket / rate)
+            bucket = 0.0
+            now = time.monotonic()
+        self._bucket = bucket
+        self._bucket_mono = now
         return True
 
 
@@ -232,8 +375,6 @@ class DTNNode:
         self.stats = stats
         self.is_sender = is_sender
         self.cla: TCPConvergenceLayer | None = None
-        self.pending_bundles: list[Bundle] = []
-        self.received_data = bytearray()
         self._stop = threading.Event()
 
     def start(self):
@@ -249,8 +390,10 @@ class DTNNode:
     def _on_bundle_received(self, bundle: Bundle):
         """Handle received bundle."""
         self.stats.segments_received += 1
-        self.stats.bytes_received += len(bundle.payload.data)
-        self.received_data.extend(bundle.payload.data)
+        data = bundle.payload.data
+        self.stats.bytes_received += len(data)
+        # Only the digest is kept; the data itself is not stored
+        self.stats.recv_hasher.update(data)
 
         # Progress update every 10 segments
         if self.stats.segments_received % 10 == 0:
@@ -259,7 +402,7 @@ class DTNNode:
             eta_sec = (self.stats.total_bytes - self.stats.bytes_received) / rate if rate > 0 else 0
             eta = timedelta(seconds=int(eta_sec))
 
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] "
+            print(f"\r[{_wall_clock()}] "
                   f"Progress: {self.stats.progress_pct:.1f}% | "
                   f"Received: {self.stats.bytes_received:,} / {self.stats.total_bytes:,} bytes | "
                   f"Rate: {rate*8:.0f} bps | "
@@ -268,7 +411,7 @@ class DTNNode:
 
 def run_sender(
     dest_eid: EndpointID,
-    payload: bytes,
+    payload: bytes | TestPayload,
     segment_size: int,
     link_sim: SpaceLinkSimulator,
     stats: TransferStats,
@@ -288,9 +431,19 @@ def run_sender(
     conn = None
     offset = 0
 
+    # Segments of an in-memory payload are views into it, so the only
+    # copy of their data is into the encoded bundle; a TestPayload
+    # generates each segment as it is sliced
+    payload_view = payload if isinstance(payload, TestPayload) else memoryview(payload)
+
+    # Segments the simulated link carries in about SEND_BATCH_SEC go out
+    # as one batch, so fast links do not pay a socket write per segment;
+    # at low rates a batch is a single segment, as before
+    batch_limit = max(segment_size, int(link_sim.bytes_per_sec * SEND_BATCH_SEC))
+
     while offset < len(payload) and not stop_event.is_set():
         # Check link state
-        if link_sim.get_state() == LinkState.LOS:
+        if link_sim.get_state() is _LOS:
             time.sleep(1)
             continue
 
@@ -304,25 +457,35 @@ def run_sender(
                 time.sleep(5)
                 continue
 
-        # Send next segment
-        segment = payload[offset:offset + segment_size]
-
-        bundle = Bundle.create(
-            destination=dest_eid,
-            source=sender_eid,
-            payload=segment,
-            lifetime_ms=86400000,  # 24 hours
-        )
+        # Send next batch of segments
+        batch_end = min(offset + batch_limit, len(payload))
+        segments = [
+            payload_view[start:start + segment_size]
+            for start in range(offset, batch_end, segment_size)
+        ]
+        batch_bytes = sum(map(len, segments))
+
+        bundles = [
+            Bundle.create(
+                destination=dest_eid,
+                source=sender_eid,
+                payload=segment,
+                lifetime_ms=86400000,  # 24 hours
+            )
+            for segment in segments
+        ]
 
         try:
             # Rate limit
-            if not link_sim.rate_limit_send(segment):
+            if not link_sim.rate_limit_send(batch_bytes):
                 continue  # LOS during send
 
-            conn.send_bundle(bundle)
-            stats.segments_sent += 1
-            stats.bytes_sent += len(segment)
-            offset += len(segment)
+            conn.send_bundles(bundles)
+            for segment in segments:
+                stats.send_hasher.update(segment)
+            stats.segments_sent += len(segments)
+            stats.bytes_sent += batch_bytes
+            offset += batch_bytes
 
         except Exception as e:
             print(f"\n[SENDER] Send error: {e}")
@@ -330,13 +493,24 @@ def run_sender(
             time.sleep(1)
 
     if conn:
+        # A batch can still be in flight; closing now would reset the
+        # connection and drop it at the receiver
+        deadline = time.monotonic() + DRAIN_TIMEOUT_SEC
+        while (stats.bytes_received < stats.bytes_sent and not stop_event.is_set()
+               and time.monotonic() < deadline):
+            time.sleep(0.1)
         conn.stop()
 
     print(f"\n[SENDER] Transmission complete: {stats.segments_sent} segments sent")
 
 
-def print_summary(stats: TransferStats, payload: bytes, received_data: bytes):
-    """Print final test summary."""
+def print_summary(stats: TransferStats, expected_digest: str):
+    """
+    Print final test summary.
+
+    expected_digest is the BLAKE2b hex digest of the payload as
+    generated, independent of what the sender actually sent.
+    """
     print("\n")
     print("=" * 70)
     print("LONG-DURATION DTN TRANSFER TEST - FINAL SUMMARY")
@@ -355,16 +529,21 @@ def print_summary(stats: TransferStats, payload: bytes, received_data: bytes):
     print(f"AOS events:         {stats.aos_events}")
     print()
 
-    # Verify data integrity
-    if len(received_data) == len(payload):
-        if received_data == payload:
-            print("DATA INTEGRITY:     VERIFIED (MD5 match)")
-            print(f"  Expected MD5:     {hashlib.md5(payload).hexdigest()}")
-            print(f"  Received MD5:     {hashlib.md5(received_data).hexdigest()}")
+    # Verify the received data against the payload's own digest; the
+    # sender's digest only tells where a mismatch came from
+    if stats.bytes_received == stats.total_bytes:
+        received_digest = stats.recv_hasher.hexdigest()
+        if received_digest == expected_digest:
+            print("DATA INTEGRITY:     VERIFIED (BLAKE2b match)")
+            print(f"  Expected BLAKE2b: {expected_digest}")
+            print(f"  Received BLAKE2b: {received_digest}")
+        elif stats.send_hasher.hexdigest() != expected_digest:
+            print("DATA INTEGRITY:     FAILED (sender did not send the payload)")
         else:
             print("DATA INTEGRITY:     FAILED (content mismatch)")
     else:
-        print(f"DATA INTEGRITY:     INCOMPLETE ({len(received_data)} of {len(payload)} bytes)")
+        print(f"DATA INTEGRITY:     INCOMPLETE "
+              f"({stats.bytes_received} of {stats.total_bytes} bytes)")
 
     print()
     print(f"Effective rate:     {stats.bytes_received * 8 / stats.elapsed_sec:.1f} bps")
@@ -380,6 +559,8 @@ def main():
                         help=f"Data rate in bps (default: {DEFAULT_DATA_RATE_BPS})")
     parser.add_argument("--segment-size", type=int, default=256,
                         help="Bundle segment size in bytes (default: 256)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed for a reproducible contact plan (default: random)")
     args = parser.parse_args()
 
     # Calculate payload size for desired duration
@@ -402,7 +583,7 @@ def main():
     print()
 
     # Generate contact plan
-    contact_plan = create_contact_plan(args.duration)
+    contact_plan = create_contact_plan(args.duration, args.seed)
     print("Contact Plan (Ground Station Passes):")
     for i, contact in enumerate(contact_plan[:10]):  # Show first 10
         print(f"  {i+1}. {contact}")
@@ -414,10 +595,14 @@ def main():
     stats = TransferStats(total_bytes=payload_size)
     link_sim = SpaceLinkSimulator(args.rate, contact_plan, stats)
 
-    # Generate payload
-    print("Generating test payload...")
-    payload = generate_test_payload(payload_size)
-    print(f"  Payload MD5: {hashlib.md5(payload).hexdigest()}")
+    # Payload is generated segment by segment as it is sent; only its
+    # digest is computed up front
+    print("Hashing test payload...")
+    payload = TestPayload(payload_size)
+    payload_hasher = _new_hasher()
+    for block in payload.blocks():
+        payload_hasher.update(block)
+    print(f"  Payload BLAKE2b: {payload_hasher.hexdigest()}")
     print()
 
     # Setup receiver
@@ -438,7 +623,7 @@ def main():
     print("Press Ctrl+C to stop early and see summary")
     print()
 
-    stats.start_time = datetime.now()
+    stats.start()
     link_sim.start()
     receiver.start()
 
@@ -463,7 +648,7 @@ def main():
     receiver.stop()
 
     # Summary
-    print_summary(stats, payload, bytes(receiver.received_data))
+    print_summary(stats, payload_hasher.hexdigest())
 
 
 if __name__ == "__main__":
@@ -4,12 +4,34 @@ Bundle Structure Tests
 Verifies bundle structure per RFC 9171 Section 4.2.
 """
 
+import time
 import unittest
 
-from ..blocks.payload import PayloadBlock
-from ..blocks.primary import PrimaryBlock
+from ..blocks.payload import (
+    BlockProcessingFlags,
+    BlockType,
+    BundleAgeBlock,
+    CRCType,
+    HopCountBlock,
+    PayloadBlock,
+)
+from ..blocks.primary import BundleProcessingFlags, PrimaryBlock
+from ..blocks.primary import CRCType as PrimaryCRCType
 from ..core.bundle import Bundle
 from ..core.eid import EndpointID
+from ..core.time import DTN_EPOCH_UNIX, CreationTimestamp, DTNTime
+from ..encoding.cbor import cbor_encode
+from ..encoding.crc import replace_crc_in_block
+
+
+def _make_bundle(payload=b"test", **kwargs):
+    """Create a bundle from ipn:1.1 to ipn:2.1."""
+    return Bundle.create(
+        destination=EndpointID.ipn(2, 1),
+        source=EndpointID.ipn(1, 1),
+        payload=payload,
+        **kwargs,
+    )
 
 
 class TestBundleCreation(unittest.TestCase):
@@ -41,59 +63,114 @@ class TestBundleCreation(unittest.TestCase):
 
     def test_bundle_has_primary_block(self):
         """Bundle contains required primary block."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         self.assertIsInstance(bundle.primary, PrimaryBlock)
         self.assertEqual(bundle.primary.VERSION, 7)
 
     def test_bundle_has_payload_block(self):
         """Bundle contains required payload block."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         self.assertIsInstance(bundle.payload, PayloadBlock)
         self.assertEqual(bundle.payload.block_number, 1)
 
     def test_bundle_lifetime(self):
         """Bundle has specified lifetime."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-            lifetime_ms=7200000,  # 2 hours
-        )
+        bundle = _make_bundle(lifetime_ms=7200000)  # 2 hours
 
         self.assertEqual(bundle.primary.lifetime_ms, 7200000)
 
     def test_bundle_creation_timestamp(self):
         """Bundle has creation timestamp."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         self.assertFalse(bundle.creation_time.time.is_unknown)
         self.assertGreater(bundle.creation_time.time.milliseconds, 0)
 
+    def test_null_values_shared(self):
+        """Unknown time, null timestamp and dtn:none are single instances."""
+        self.assertIs(DTNTime.unknown(), DTNTime.unknown())
+        self.assertIs(CreationTimestamp.none(), CreationTimestamp.none())
+        self.assertIs(CreationTimestamp.none().time, DTNTime.unknown())
+        self.assertIs(EndpointID.none(), EndpointID.none())
+
+    def test_dtn_time_now(self):
+        """DTNTime.now() is wall-clock time relative to the DTN epoch."""
+        before = int((time.time() - DTN_EPOCH_UNIX) * 1000) - 1
+        now = DTNTime.now().milliseconds
+        after = int((time.time() - DTN_EPOCH_UNIX) * 1000) + 1
+        self.assertIsInstance(now, int)
+        self.assertTrue(before <= now <= after)
+
+    def test_duplicate_block_numbers_rejected(self):
+        """Extension block numbers must be unique and not 0 or 1."""
+        bundle = _make_bundle()
+        for numbers in ((2, 2), (1,), (0, 3)):
+            with self.assertRaises(ValueError):
+                Bundle(
+                    primary=bundle.primary,
+                    payload=bundle.payload,
+                    extensions=[HopCountBlock(block_number=n) for n in numbers],
+                )
+
+        bundle = Bundle(
+            primary=bundle.primary,
+            payload=bundle.payload,
+            extensions=[HopCountBlock(block_number=n) for n in (2, 3)],
+        )
+        self.assertEqual(len(bundle.extensions), 2)
+
+    def test_no_instance_dict(self):
+        """Bundle objects use slots instead of a per-instance __dict__."""
+        bundle = _make_bundle()
+        for obj in (
+            bundle,
+            bundle.primary,
+            bundle.payload,
+            bundle.destination,
+            bundle.creation_time,
+            bundle.creation_time.time,
+        ):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+
+
+class TestBundleBlocks(unittest.TestCase):
+    """Tests for block lookup."""
+
+    def test_get_block(self):
+        """Blocks are found by type, including ones added later."""
+        bundle = _make_bundle()
+        self.assertIs(bundle.get_block(BlockType.PAYLOAD), bundle.payload)
+        self.assertIsNone(bundle.get_block(BlockType.HOP_COUNT))
+
+        hop_count = HopCountBlock(block_number=0)
+        bundle.add_extension(hop_count)
+        self.assertIs(bundle.get_block(BlockType.HOP_COUNT), hop_count)
+
+        # Direct list changes are picked up too
+        age = BundleAgeBlock(block_number=5)
+        bundle.extensions.append(age)
+        self.assertIs(bundle.get_block(BlockType.BUNDLE_AGE), age)
+        bundle.extensions = [age]
+        self.assertIsNone(bundle.get_block(BlockType.HOP_COUNT))
+
+        # In-place replacement, and remove followed by append
+        bundle.extensions[0] = hop_count
+        self.assertIs(bundle.get_block(BlockType.HOP_COUNT), hop_count)
+        self.assertIsNone(bundle.get_block(BlockType.BUNDLE_AGE))
+        bundle.extensions.remove(hop_count)
+        bundle.extensions.append(age)
+        self.assertIs(bundle.get_block(BlockType.BUNDLE_AGE), age)
+        self.assertIsNone(bundle.get_block(BlockType.HOP_COUNT))
+
 
 class TestBundleEncoding(unittest.TestCase):
     """Tests for bundle CBOR encoding."""
 
     def test_encode_produces_bytes(self):
         """Encoding produces bytes."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         encoded = bundle.encode()
         self.assertIsInstance(encoded, bytes)
@@ -101,11 +178,7 @@ class TestBundleEncoding(unittest.TestCase):
 
     def test_encoded_starts_with_indefinite_array(self):
         """Encoded bundle starts with indefinite array marker."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         encoded = bundle.encode()
         # 0x9F is indefinite-length array start
@@ -113,27 +186,102 @@ class TestBundleEncoding(unittest.TestCase):
 
     def test_encoded_ends_with_break(self):
         """Encoded bundle ends with break code."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         encoded = bundle.encode()
         # 0xFF is break code
         self.assertEqual(encoded[-1], 0xFF)
 
+    def test_encode_matches_generic_cbor(self):
+        """Bundle encoding equals generic CBOR encoding of its blocks."""
+        for size in (0, 23, 24, 300, 70000):
+            bundle = _make_bundle(bytes(size))
+            bundle.add_extension(HopCountBlock(block_number=2))
+            expected = (
+                b'\x9f'
+                + cbor_encode(bundle.primary.to_cbor_array())
+                + cbor_encode(bundle.payload.to_cbor_array())
+                + cbor_encode(bundle.extensions[0].to_cbor_array())
+                + b'\xff'
+            )
+            self.assertEqual(bundle.encode(), expected)
+
+    def test_payload_encode_for_crc(self):
+        """Payload CRC encoding appends a zeroed CRC field to the block."""
+        block = PayloadBlock(data=b"payload", crc_type=CRCType.CRC32C)
+        expected = cbor_encode(block.to_cbor_array() + [b'\x00\x00\x00\x00'])
+        self.assertEqual(block.encode_for_crc(), expected)
+
+        block = PayloadBlock(data=b"payload", crc_type=CRCType.NONE)
+        self.assertEqual(block.encode_for_crc(), cbor_encode(block.to_cbor_array()))
+
+    def test_payload_encode_with_crc(self):
+        """Payload CRC computed in pieces matches the whole-block CRC."""
+        for crc_type in CRCType:
+            block = PayloadBlock(data=bytes(range(256)) * 4, crc_type=crc_type)
+            encoded = block.encode_with_crc()
+            self.assertEqual(
+                encoded, replace_crc_in_block(block.encode_for_crc(), int(crc_type))
+            )
+
+    def test_primary_encode_for_crc(self):
+        """Primary CRC encoding appends a zeroed CRC field to the block."""
+        primary = _make_bundle().primary
+        for crc_type, crc_field in (
+            (PrimaryCRCType.NONE, []),
+            (PrimaryCRCType.CRC16, [b'\x00\x00']),
+            (PrimaryCRCType.CRC32C, [b'\x00\x00\x00\x00']),
+        ):
+            primary.crc_type = crc_type
+            expected = cbor_encode(primary.to_cbor_array() + crc_field)
+            self.assertEqual(primary.encode_for_crc(), expected)
+
+    def test_primary_encode_with_crc(self):
+        """Primary CRC computed while assembling matches the patched block."""
+        primary = _make_bundle().primary
+        for crc_type in (PrimaryCRCType.NONE, PrimaryCRCType.CRC16, PrimaryCRCType.CRC32C):
+            primary.crc_type = crc_type
+            self.assertEqual(
+                primary.encode_with_crc(),
+                replace_crc_in_block(primary.encode_for_crc(), int(crc_type)),
+            )
+
+    def test_primary_array_reuses_eid_values(self):
+        """Primary block array holds the EIDs' own CBOR values, not copies."""
+        primary = _make_bundle().primary
+        arr = primary.to_cbor_array()
+        self.assertIs(arr[3], primary.destination.to_cbor_value())
+        self.assertEqual(PrimaryBlock.from_cbor_array(arr), primary)
+
+    def test_primary_encode_fragment(self):
+        """Fragment primary block encoding includes the fragment fields."""
+        primary = Bundle.create(
+            destination=EndpointID.dtn("//node2/inbox"),
+            source=EndpointID.ipn(1, 1),
+            payload=b"test",
+        ).primary
+        primary.flags = BundleProcessingFlags.IS_FRAGMENT
+        primary.fragment_offset = 1000
+        primary.total_adu_length = 70000
+        self.assertEqual(primary.encode(), cbor_encode(primary.to_cbor_array()))
+
+    def test_primary_encode_for_crc_follows_assignment(self):
+        """Assigning a primary block field discards its cached encoding."""
+        primary = _make_bundle().primary
+        before = primary.encode_for_crc()
+        primary.lifetime_ms = 1000
+        after = primary.encode_for_crc()
+
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, cbor_encode(primary.to_cbor_array() + [b'\x00\x00']))
+
 
 class TestBundleDecoding(unittest.TestCase):
     """Tests for bundle CBOR decoding."""
 
     def test_decode_round_trip(self):
         """Encode then decode preserves bundle."""
-        original = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"Hello, DTN!",
-        )
+        original = _make_bundle(b"Hello, DTN!")
 
         encoded = original.encode()
         decoded = Bundle.decode(encoded)
@@ -142,17 +290,54 @@ class TestBundleDecoding(unittest.TestCase):
         self.assertEqual(str(decoded.source), str(original.source))
         self.assertEqual(decoded.payload.data, original.payload.data)
 
+    def test_decode_primary_only(self):
+        """Primary block decodes without parsing the rest of the bundle."""
+        original = _make_bundle(b"Hello, DTN!" * 100)
+        encoded = original.encode()
+
+        primary = Bundle.decode_primary(encoded)
+        self.assertEqual(primary.destination, original.destination)
+        self.assertEqual(primary.creation_timestamp, original.creation_time)
+
+        # Payload block cut short; only the primary block is read
+        truncated = encoded[:len(original.primary.encode()) + 3]
+        self.assertEqual(Bundle.decode_primary(truncated).source, original.source)
+        with self.assertRaises(ValueError):
+            Bundle.decode(truncated)
+
+    def test_payload_block_fields_decoded(self):
+        """Decoded payload block carries enum-typed flags and CRC type."""
+        block = PayloadBlock.from_cbor_array([1, 1, 0x04, 2, b"data"])
+        self.assertEqual(block.flags, BlockProcessingFlags.DELETE_IF_UNPROCESSABLE)
+        self.assertIs(block.crc_type, CRCType.CRC32C)
+
+    def test_block_flags_many_values(self):
+        """Flags decode correctly across many distinct received values."""
+        values = list(range(0x100, 0x500))
+        for _ in range(2):  # Second pass decodes values evicted from the cache
+            for value in values:
+                block = PayloadBlock.from_cbor_array([1, 1, value, 0, b"data"])
+                self.assertIsInstance(block.flags, BlockProcessingFlags)
+                self.assertEqual(block.flags, value)
+
+    def test_payload_block_number_fixed(self):
+        """Payload block number is always 1 and not a constructor argument."""
+        self.assertEqual(PayloadBlock(data=b"x").block_number, 1)
+        with self.assertRaises(TypeError):
+            PayloadBlock(block_number=2, data=b"x")
+
+    def test_payload_block_unknown_crc_type(self):
+        """Unknown CRC type in a payload block is rejected."""
+        with self.assertRaises(ValueError):
+            PayloadBlock.from_cbor_array([1, 1, 0, 9, b"data"])
+
 
 class TestBundleID(unittest.TestCase):
     """Tests for bundle identification."""
 
     def test_bundle_id_format(self):
         """Bundle ID has correct format."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-        )
+        bundle = _make_bundle()
 
         bid = bundle.bundle_id
         parts = bid.split('/')
@@ -161,19 +346,29 @@ class TestBundleID(unittest.TestCase):
         self.assertEqual(len(parts), 3)
         self.assertEqual(parts[0], "ipn:1.1")
 
+    def test_flag_properties_follow_assignment(self):
+        """Flag tests see flags assigned after construction."""
+        primary = _make_bundle().primary
+        self.assertFalse(primary.is_admin_record)
+        primary.flags = BundleProcessingFlags.IS_ADMIN_RECORD
+        self.assertTrue(primary.is_admin_record)
+        self.assertFalse(primary.is_fragment)
+
+    def test_bundle_id_follows_primary_block(self):
+        """Bundle ID is reused, and rebuilt after a primary field changes."""
+        bundle = _make_bundle()
+        first = bundle.bundle_id
+        self.assertIs(bundle.bundle_id, first)
+
+        bundle.primary.flags = BundleProcessingFlags.IS_FRAGMENT
+        bundle.primary.fragment_offset = 100
+        bundle.primary.total_adu_length = 1000
+        self.assertEqual(bundle.bundle_id, first + "/100")
+
     def test_unique_bundle_ids(self):
         """Different bundles have different IDs."""
-        Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test1",
-        )
-
-        Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test2",
-        )
+        _make_bundle(b"test1")
+        _make_bundle(b"test2")
 
         # Different creation times make different IDs
         # (may be same if created in same millisecond)
@@ -184,12 +379,7 @@ class TestBundleExpiration(unittest.TestCase):
 
     def test_expiration_time(self):
         """Bundle expiration time is calculated correctly."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-            lifetime_ms=1000,  # 1 second
-        )
+        bundle = _make_bundle(lifetime_ms=1000)  # 1 second
 
         expiry = bundle.primary.expiration_time
         self.assertIsNotNone(expiry)
@@ -199,12 +389,7 @@ class TestBundleExpiration(unittest.TestCase):
 
     def test_not_expired(self):
         """New bundle is not expired."""
-        bundle = Bundle.create(
-            destination=EndpointID.ipn(2, 1),
-            source=EndpointID.ipn(1, 1),
-            payload=b"test",
-            lifetime_ms=3600000,  # 1 hour
-        )
+        bundle = _make_bundle(lifetime_ms=3600000)  # 1 hour
 
         self.assertFalse(bundle.is_expired())
 
@@ -7,7 +7,7 @@ and RFC 9171 deterministic encoding requirements.
 
 import unittest
 
-from ..encoding.cbor import cbor_decode, cbor_encode
+from ..encoding.cbor import CBORDecoder, CBORMajorType, cbor_decode, cbor_encode
 
 
 class TestCBOREncoder(unittest.TestCase):
@@ -85,6 +85,23 @@ class TestCBOREncoder(unittest.TestCase):
         self.assertEqual(cbor_encode(False), bytes([0xF4]))
         self.assertEqual(cbor_encode(True), bytes([0xF5]))
 
+    def test_encode_int_subclass(self):
+        """Enum members encode as their integer value, inside arrays too."""
+        self.assertEqual(cbor_encode(CBORMajorType.MAP), bytes([5]))
+        self.assertEqual(
+            cbor_encode([CBORMajorType.ARRAY, True, (1, 300)]),
+            bytes([0x83, 4, 0xF5, 0x82, 1, 0x19, 0x01, 0x2C]),
+        )
+
+    def test_encode_subclasses_and_unsupported(self):
+        """Subclasses of supported types encode; other types are rejected."""
+        class Text(str):
+            pass
+
+        self.assertEqual(cbor_encode(Text("a")), bytes([0x61, 0x61]))
+        with self.assertRaises(TypeError):
+            cbor_encode(1.5)
+
     def test_encode_null(self):
         """Null encodes as simple value 22."""
         self.assertEqual(cbor_encode(None), bytes([0xF6]))
@@ -101,6 +118,14 @@ class TestCBOREncoder(unittest.TestCase):
         self.assertEqual(decoded[2], "b")
         self.assertEqual(decoded[10], "c")
 
+    def test_map_keys_sorted_by_encoding(self):
+        """Key order follows the encoded bytes, not the Python values."""
+        m = {"b": 1, 300: 2, -1: 3, "a": [4]}
+        self.assertEqual(
+            cbor_encode(m),
+            bytes([0xA4, 0x19, 0x01, 0x2C, 2, 0x20, 3, 0x61, 0x61, 0x81, 4, 0x61, 0x62, 1]),
+        )
+
 
 class TestCBORDecoder(unittest.TestCase):
     """Tests for CBOR decoding per RFC 8949."""
@@ -112,6 +137,14 @@ class TestCBORDecoder(unittest.TestCase):
         self.assertEqual(cbor_decode(bytes([0x18, 24])), 24)
         self.assertEqual(cbor_decode(bytes([0x19, 0x01, 0x00])), 256)
 
+    def test_decode_multi_byte_arguments(self):
+        """Decode 2, 4 and 8 byte arguments; truncated ones are rejected."""
+        for value in (65535, 2**32 - 1, 2**64 - 1):
+            encoded = cbor_encode(value)
+            self.assertEqual(cbor_decode(encoded), value)
+            with self.assertRaises(ValueError):
+                cbor_decode(encoded[:-1])
+
     def test_decode_negative_int(self):
         """Decode negative integers."""
         self.assertEqual(cbor_decode(bytes([0x20])), -1)
@@ -132,11 +165,44 @@ class TestCBORDecoder(unittest.TestCase):
         encoded = bytes([0x83, 1, 2, 3])
         self.assertEqual(cbor_decode(encoded), [1, 2, 3])
 
+    def test_decode_array_mixed_heads(self):
+        """Small integers mixed with longer items decode in order."""
+        value = [0, 23, 24, -1, 1000, b"x", [1, 70000], "t"]
+        self.assertEqual(cbor_decode(cbor_encode(value)), value)
+
+    def test_decode_truncated_array(self):
+        """Array shorter than its declared length is rejected."""
+        with self.assertRaises(ValueError):
+            cbor_decode(bytes([0x83, 1, 2]))
+
+    def test_decode_array_start(self):
+        """Array head is read on its own, items decoded one at a time."""
+        decoder = CBORDecoder(bytes([0x9F, 1, 0x42]) + b"ab" + bytes([0xFF]))
+        self.assertEqual(decoder.decode_array_start(), -1)
+        self.assertEqual(decoder.decode(), 1)
+        self.assertEqual(decoder.decode(), b"ab")
+
+        self.assertEqual(CBORDecoder(bytes([0x83, 1, 2, 3])).decode_array_start(), 3)
+        with self.assertRaises(ValueError):
+            CBORDecoder(bytes([0x01])).decode_array_start()
+
+    def test_decode_from_bytearray(self):
+        """Buffers decode in place; strings come back as independent bytes."""
+        buf = bytearray(cbor_encode([b"abc", "text", 300]))
+        decoded = CBORDecoder(buf).decode()
+        self.assertEqual(decoded, [b"abc", "text", 300])
+        self.assertIs(type(decoded[0]), bytes)
+        buf[2] = ord("x")
+        self.assertEqual(decoded[0], b"abc")
+
     def test_decode_indefinite_array(self):
         """Decode indefinite-length arrays."""
         # 0x9F starts indefinite array, 0xFF breaks
         encoded = bytes([0x9F, 1, 2, 3, 0xFF])
         self.assertEqual(cbor_decode(encoded), [1, 2, 3])
+        self.assertEqual(cbor_decode(bytes([0x9F, 0x9F, 0xFF, 0xFF])), [[]])
+        with self.assertRaises(ValueError):
+            cbor_decode(encoded[:-1])
 
     def test_round_trip(self):
         """Test encode/decode round-trip."""
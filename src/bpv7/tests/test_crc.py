@@ -6,7 +6,18 @@ Verifies CRC-16 and CRC-32C per RFC 9171 Section 4.2.1.
 
 import unittest
 
-from ..encoding.crc import calculate_block_crc, crc16_x25, crc32c
+from ..encoding import crc
+from ..encoding.crc import calculate_block_crc, crc16_x25, crc32c, verify_block_crc
+
+
+def _crc16_x25_bitwise(data):
+    """Reference bit-at-a-time CRC-16 X.25."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x8408 if crc & 1 else crc >> 1
+    return crc ^ 0xFFFF
 
 
 class TestCRC16(unittest.TestCase):
@@ -33,6 +44,27 @@ class TestCRC16(unittest.TestCase):
         crc2 = crc16_x25(data)
         self.assertEqual(crc1, crc2)
 
+    def test_crc16_matches_bitwise_reference(self):
+        """CRC-16 agrees with a bit-at-a-time implementation."""
+        for length in (0, 1, 2, 7, 64, 1000):
+            data = bytes((i * 37 + length) & 0xFF for i in range(length))
+            self.assertEqual(crc16_x25(data), _crc16_x25_bitwise(data))
+
+    def test_crc16_accepts_bytearray(self):
+        """CRC-16 accepts any bytes-like input."""
+        self.assertEqual(crc16_x25(bytearray(b'123456789')), 0x906E)
+
+    def test_crc16_incremental(self):
+        """CRC-16 computed in pieces equals CRC-16 of the whole."""
+        crc = crc16_x25(b'5678', crc16_x25(b'1234'))
+        self.assertEqual(crc16_x25(b'9', crc), 0x906E)
+
+    def test_crc16_residue(self):
+        """Data followed by its CRC verifies against the good residue."""
+        data = b'block data'
+        block = data + crc16_x25(data).to_bytes(2, 'little')
+        self.assertTrue(verify_block_crc(block, 1))
+
 
 class TestCRC32C(unittest.TestCase):
     """Tests for CRC-32C (Castagnoli) implementation."""
@@ -57,6 +89,32 @@ class TestCRC32C(unittest.TestCase):
         crc2 = crc32c(data)
         self.assertEqual(crc1, crc2)
 
+    def test_crc32c_incremental(self):
+        """CRC-32C computed in pieces equals CRC-32C of the whole."""
+        crc = crc32c(b'5678', crc32c(b'1234'))
+        self.assertEqual(crc32c(b'9', crc), 0xE3069283)
+
+    def test_crc32c_fallback_known_values(self):
+        """Table-driven fallback matches the test vector on its own."""
+        self.assertEqual(crc._crc32c_table(b'123456789'), 0xE3069283)
+
+    def test_crc32c_fallback_unaligned_lengths(self):
+        """Slicing-by-8 fallback agrees with a bytewise CRC at every tail length."""
+        table = crc._CRC32C_TABLE
+        data = bytes(range(7, 250))
+        for length in range(0, 25):
+            expected = 0xFFFFFFFF
+            for byte in data[:length]:
+                expected = table[(expected ^ byte) & 0xFF] ^ (expected >> 8)
+            self.assertEqual(crc._crc32c_table(data[:length]), expected ^ 0xFFFFFFFF)
+
+    @unittest.skipIf(crc._crc32c_native is None, "crc32c package not installed")
+    def test_crc32c_native_matches_fallback(self):
+        """Native CRC-32C agrees with the table-driven fallback."""
+        data = bytes(range(256)) * 5
+        self.assertEqual(crc32c(data), crc._crc32c_table(data))
+        self.assertEqual(crc32c(b'9', crc32c(b'12345678')), crc._crc32c_table(b'123456789'))
+
 
 class TestBlockCRC(unittest.TestCase):
     """Tests for block CRC calculation."""
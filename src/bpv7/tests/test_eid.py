@@ -7,6 +7,7 @@ Verifies EID handling per RFC 9171 Section 4.2.5.
 import unittest
 
 from ..core.eid import EIDScheme, EndpointID
+from ..encoding.cbor import cbor_encode
 
 
 class TestEndpointID(unittest.TestCase):
@@ -76,7 +77,16 @@ class TestEndpointID(unittest.TestCase):
         """ipn: encodes as [2, [node, service]]."""
         eid = EndpointID.ipn(42, 7)
         cbor_val = eid.to_cbor_value()
-        self.assertEqual(cbor_val, (2, [42, 7]))
+        self.assertEqual(cbor_val, (2, (42, 7)))
+        self.assertIsInstance(cbor_val[1], tuple)
+        self.assertEqual(cbor_encode(cbor_val), bytes([0x82, 0x02, 0x82, 0x18, 42, 0x07]))
+
+    def test_str_and_cbor_value_reused(self):
+        """String and CBOR forms are computed once per EID."""
+        eid = EndpointID.ipn(42, 8)
+        self.assertIs(str(eid), str(eid))
+        self.assertIs(eid.to_cbor_value(), eid.to_cbor_value())
+        self.assertEqual(str(eid), "ipn:42.8")
 
     def test_cbor_round_trip(self):
         """CBOR encode/decode round trip."""
@@ -105,11 +115,45 @@ class TestEndpointID(unittest.TestCase):
         with self.assertRaises(ValueError):
             EndpointID.ipn(0, -1)
 
+    def test_invalid_cbor_value(self):
+        """Malformed CBOR EIDs raise ValueError, including unhashable parts."""
+        for value in ([2, [[1], 0]], [2, [1, {}]], [2, [1.5, 0]], [1, [b"x"]], [1, b"x"]):
+            with self.assertRaises(ValueError):
+                EndpointID.from_cbor_value(value)
+        with self.assertRaises(ValueError):
+            EndpointID.dtn(["//node1/"])
+
     def test_invalid_parse(self):
         """Unknown scheme raises error."""
         with self.assertRaises(ValueError):
             EndpointID.parse("unknown:foo")
 
+    def test_invalid_parse_ipn(self):
+        """Malformed ipn: strings raise error."""
+        for eid_string in ("ipn:1", "ipn:1.", "ipn:.1", "ipn:1.2.3", "ipn:-1.0", "ipn:1.x"):
+            with self.assertRaises(ValueError):
+                EndpointID.parse(eid_string)
+
+    def test_usable_as_dict_key(self):
+        """Equal EIDs built different ways hash and compare equal."""
+        routes = {EndpointID.ipn(2, 0): "a", EndpointID.dtn("//node1/"): "b"}
+        self.assertEqual(routes[EndpointID.parse("ipn:2.0")], "a")
+        self.assertEqual(routes[EndpointID.parse("dtn://node1/")], "b")
+        self.assertNotIn(EndpointID.ipn(2, 1), routes)
+
+    def test_constructors_share_instances(self):
+        """Constructors return one shared instance per EID."""
+        self.assertIs(EndpointID.parse("ipn:3.1"), EndpointID.ipn(3, 1))
+        self.assertIs(EndpointID.from_cbor_value((2, [3, 1])), EndpointID.ipn(3, 1))
+        self.assertIs(EndpointID.parse("dtn://n/"), EndpointID.dtn("//n/"))
+        self.assertIs(EndpointID.parse("dtn:none"), EndpointID.none())
+
+    def test_cached_constructor_still_validates(self):
+        """Values equal to a cached EID but of the wrong type are rejected."""
+        EndpointID.ipn(1, 0)
+        with self.assertRaises(ValueError):
+            EndpointID.ipn(1.0, 0)
+
 
 class TestEIDSingleton(unittest.TestCase):
     """Tests for singleton endpoint detection."""
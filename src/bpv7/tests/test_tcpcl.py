@@ -0,0 +1,658 @@
+"""
+TCPCL Tests
+
+Verifies TCP Convergence Layer v4 wire formats per RFC 9174.
+"""
+
+import socket
+import struct
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from ..agent import tcpcl
+from ..agent.tcpcl import (
+    TCPCL_MAGIC,
+    ContactHeader,
+    SessionInit,
+    TCPCLConnection,
+    TCPCLMessageType,
+    TCPConvergenceLayer,
+)
+from ..core.bundle import Bundle
+from ..core.eid import EndpointID
+
+_SOURCE = EndpointID.ipn(1, 1)
+_DESTINATION = EndpointID.ipn(2, 1)
+
+
+def _make_bundle(payload, source=_SOURCE, destination=_DESTINATION):
+    """Create a bundle carrying payload, by default from ipn:1.1 to ipn:2.1."""
+    return Bundle.create(destination=destination, source=source, payload=payload)
+
+
+def _segment(transfer_id, data, flags=0x03, ext_items=b''):
+    """Encode a raw XFER_SEGMENT; START segments carry ext_items."""
+    msg = struct.pack('!BBQ', TCPCLMessageType.XFER_SEGMENT, flags, transfer_id)
+    if flags & 0x02:
+        msg += struct.pack('!I', len(ext_items)) + ext_items
+    return msg + struct.pack('!Q', len(data)) + data
+
+
+def _length_hint(total):
+    """Transfer length extension item declaring total bytes."""
+    return struct.pack('!BHHQ', 0, 0x0001, 8, total)
+
+
+def _recv_exact(sock, n):
+    """Read exactly n bytes from a raw socket."""
+    data = b''
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("Socket closed")
+        data += chunk
+    return data
+
+
+class _Collector:
+    """Bundle callback recording what arrives; done is set after count bundles."""
+
+    def __init__(self, count=1):
+        self.count = count
+        self.bundles = []
+        self.done = threading.Event()
+
+    def __call__(self, bundle):
+        self.bundles.append(bundle)
+        if len(self.bundles) >= self.count:
+            self.done.set()
+
+    @property
+    def payloads(self):
+        return [bundle.payload.data for bundle in self.bundles]
+
+    def wait(self):
+        return self.done.wait(5)
+
+
+def _connected_pair(test, on_bundle_received=None, **kwargs):
+    """
+    Create two started TCPCL connections joined by a socket pair.
+
+    Both are stopped when the test finishes.
+    """
+    sock_a, sock_b = socket.socketpair()
+    conn_a = TCPCLConnection(sock_a, EndpointID.ipn(1, 0), **kwargs)
+    conn_b = TCPCLConnection(
+        sock_b, EndpointID.ipn(2, 0), on_bundle_received=on_bundle_received, **kwargs
+    )
+
+    # Contact header and SESS_INIT exchange blocks until both sides run
+    thread = threading.Thread(target=conn_a.start)
+    thread.start()
+    conn_b.start()
+    thread.join()
+    test.addCleanup(conn_b.stop)
+    test.addCleanup(conn_a.stop)
+    return conn_a, conn_b
+
+
+def _raw_receiver(test, on_bundle_received=None, deliver_depth=None, **sess_init):
+    """
+    Run a connection's receive and delivery threads against a raw socket.
+
+    The handshake is skipped, so the test writes TCPCL messages straight
+    to the returned socket and reads the replies. Options in sess_init
+    go into the connection's advertised SESS_INIT.
+
+    Returns:
+        (raw socket, connection, receive thread)
+    """
+    raw, sock = socket.socketpair()
+    raw.settimeout(5)
+    conn = TCPCLConnection(
+        sock,
+        EndpointID.ipn(2, 0),
+        on_bundle_received=on_bundle_received,
+        sess_init=SessionInit(node_id="ipn:2.0", **sess_init).encode(),
+    )
+    if deliver_depth is not None:
+        conn._deliver_slots = threading.Semaphore(deliver_depth)
+    conn._running = True
+    conn._deliver_thread = threading.Thread(target=conn._deliver_loop, daemon=True)
+    conn._deliver_thread.start()
+    thread = threading.Thread(target=conn._receive_loop, daemon=True)
+    thread.start()
+    test.addCleanup(raw.close)
+    test.addCleanup(conn.stop)
+    return raw, conn, thread
+
+
+def _listener(test, on_bundle=None):
+    """Start a listening convergence layer for ipn:2.0; returns it and its port."""
+    receiver = TCPConvergenceLayer(EndpointID.ipn(2, 0), listen_port=0)
+    if on_bundle is not None:
+        receiver.add_bundle_handler(on_bundle)
+    receiver.start()
+    test.addCleanup(receiver.stop)
+    return receiver, receiver._server_sock.getsockname()[1]
+
+
+def _sender(test, node=1):
+    """Create a convergence layer for ipn:<node>.0, stopped after the test."""
+    sender = TCPConvergenceLayer(EndpointID.ipn(node, 0))
+    test.addCleanup(sender.stop)
+    return sender
+
+
+class TestContactHeader(unittest.TestCase):
+    """Tests for the contact header."""
+
+    def test_encode_length(self):
+        """Contact header is 6 bytes."""
+        self.assertEqual(len(ContactHeader().encode()), 6)
+
+    def test_encode_layout(self):
+        """Contact header is magic + version + flags."""
+        encoded = ContactHeader(flags=0x01).encode()
+        self.assertEqual(encoded, TCPCL_MAGIC + bytes([4, 0x01]))
+
+    def test_roundtrip(self):
+        """Decoded contact header matches encoded one."""
+        decoded = ContactHeader.decode(ContactHeader(flags=0x01).encode())
+        self.assertEqual(decoded.flags, 0x01)
+
+    def test_bad_magic_rejected(self):
+        """Wrong magic number is rejected."""
+        with self.assertRaises(ValueError):
+            ContactHeader.decode(b'abcd\x04\x00')
+
+
+class TestSessionInit(unittest.TestCase):
+    """Tests for SESS_INIT messages."""
+
+    def test_encode_layout(self):
+        """SESS_INIT fields are packed in RFC 9174 order."""
+        encoded = SessionInit(keepalive_interval=15, node_id="ipn:1.0").encode()
+
+        self.assertEqual(encoded[0], TCPCLMessageType.SESS_INIT)
+        self.assertEqual(struct.unpack('!H', encoded[1:3])[0], 15)
+        self.assertEqual(struct.unpack('!H', encoded[19:21])[0], 7)
+        self.assertEqual(encoded[21:28], b'ipn:1.0')
+        self.assertEqual(encoded[28:], b'\x00\x00\x00\x00')
+
+    def test_roundtrip(self):
+        """Decoded SESS_INIT matches encoded one."""
+        init = SessionInit(
+            keepalive_interval=60,
+            segment_mru=1024,
+            transfer_mru=4096,
+            node_id="dtn://node1/",
+        )
+        decoded = SessionInit.decode(init.encode())
+        self.assertEqual(decoded, init)
+
+    def test_truncated_rejected(self):
+        """SESS_INIT shorter than its fixed header is rejected."""
+        with self.assertRaises(ValueError):
+            SessionInit.decode(SessionInit().encode()[:20])
+
+
+class _ShortWriteSocket:
+    """Socket stand-in whose send/sendmsg accept at most a few bytes per call."""
+
+    def __init__(self):
+        self.sent = bytearray()
+
+    def send(self, data):
+        data = bytes(data)[:5]
+        self.sent.extend(data)
+        return len(data)
+
+    def sendall(self, data):
+        self.sent.extend(data)
+
+    def sendmsg(self, buffers):
+        data = b''.join(bytes(buf) for buf in buffers)[:5]
+        self.sent.extend(data)
+        return len(data)
+
+
+class TestSendGather(unittest.TestCase):
+    """Tests for scatter/gather sends."""
+
+    def test_partial_sends_resumed(self):
+        """Buffers are delivered in order across short writes."""
+        sock = _ShortWriteSocket()
+        conn = TCPCLConnection(sock, EndpointID.ipn(1, 0))
+
+        conn._send_gather(b'header', b'', b'bundle data')
+
+        self.assertEqual(bytes(sock.sent), b'headerbundle data')
+
+    def test_short_control_write_completed(self):
+        """A control message cut short by send() is finished."""
+        sock = _ShortWriteSocket()
+        conn = TCPCLConnection(sock, EndpointID.ipn(1, 0))
+
+        conn._send_small(b'0123456789')
+
+        self.assertEqual(bytes(sock.sent), b'0123456789')
+
+
+class TestConnection(unittest.TestCase):
+    """Tests for bundle transfer over a TCPCL session."""
+
+    def test_session_establishment(self):
+        """Peers learn each other's node IDs."""
+        conn_a, conn_b = _connected_pair(self)
+        self.assertEqual(conn_a.remote_eid, EndpointID.ipn(2, 0))
+        self.assertEqual(conn_b.remote_eid, EndpointID.ipn(1, 0))
+
+    def test_send_bundle(self):
+        """Bundle sent on one side is delivered on the other."""
+        collector = _Collector()
+        conn_a, _ = _connected_pair(self, collector)
+        bundle = _make_bundle(b"Hello, TCPCL!" * 100)
+        conn_a.send_bundle(bundle)
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [bundle.payload.data])
+        self.assertEqual(collector.bundles[0].bundle_id, bundle.bundle_id)
+
+    def test_resend_after_modification(self):
+        """A bundle changed after one send goes out with its new content."""
+        collector = _Collector(3)
+        conn_a, _ = _connected_pair(self, collector)
+        bundle = _make_bundle(b"resent")
+        conn_a.send_bundle(bundle)
+        bundle.primary.lifetime_ms = 5000
+        conn_a.send_bundle(bundle)
+        bundle.primary.lifetime_ms = 6000
+        conn_a.send_bundles([bundle])
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(
+            [b.primary.lifetime_ms for b in collector.bundles], [3600000, 5000, 6000]
+        )
+
+    def test_send_large_bundle(self):
+        """Bundle larger than the receive buffer is reassembled intact."""
+        collector = _Collector()
+        conn_a, _ = _connected_pair(self, collector)
+        payload = bytes(range(256)) * 2048  # 512 KiB
+        conn_a.send_bundle(_make_bundle(payload))
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [payload])
+
+    def test_send_bundle_file(self):
+        """Encoded bundle read from a file region is delivered intact."""
+        collector = _Collector()
+        conn_a, _ = _connected_pair(self, collector)
+        bundle = _make_bundle(b"stored bundle " * 1000)
+        with tempfile.TemporaryFile() as f:
+            f.write(b"junk")
+            f.write(bundle.encode())
+            conn_a.send_bundle_file(f, offset=4)
+
+            self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [bundle.payload.data])
+
+    def _send_segmented(self, ext_items):
+        """Send one bundle as three raw XFER_SEGMENTs and return what arrives."""
+        collector = _Collector()
+        conn_a, conn_b = _connected_pair(self, collector)
+        bundle = _make_bundle(b"segmented payload " * 50)
+        data = bundle.encode()
+        parts = [data[:100], data[100:500], data[500:]]
+
+        for i, part in enumerate(parts):
+            flags = (0x02 if i == 0 else 0) | (0x01 if i == len(parts) - 1 else 0)
+            conn_a.sock.sendall(_segment(7, part, flags, ext_items))
+
+        self.assertTrue(collector.wait())
+        conn_a.stop()
+        conn_b.stop()
+        return bundle, collector.bundles[0]
+
+    def test_multi_segment_transfer(self):
+        """Segments without a length hint are reassembled in order."""
+        sent, received = self._send_segmented(b'')
+        self.assertEqual(received.payload.data, sent.payload.data)
+
+    def test_multi_segment_transfer_length_hint(self):
+        """Segments are reassembled into a buffer presized by the hint."""
+        sent, _ = self._send_segmented(b'')
+        sent, received = self._send_segmented(_length_hint(len(sent.encode())))
+        self.assertEqual(received.payload.data, sent.payload.data)
+
+    def test_segments_received_in_pieces(self):
+        """Segments longer than the allocation limit arrive intact."""
+        with mock.patch.object(tcpcl, '_XFER_PREALLOC_LIMIT', 64):
+            sent, received = self._send_segmented(b'')
+            self.assertEqual(received.payload.data, sent.payload.data)
+
+            sent, received = self._send_segmented(_length_hint(len(sent.encode())))
+            self.assertEqual(received.payload.data, sent.payload.data)
+
+    def test_interleaved_colliding_transfers(self):
+        """Concurrent transfers sharing a reassembly slot stay separate."""
+        collector = _Collector(2)
+        conn_a, _ = _connected_pair(self, collector)
+        encoded = {
+            transfer_id: _make_bundle(f"transfer {transfer_id} ".encode() * 20).encode()
+            for transfer_id in (1, 65)  # Same slot index
+        }
+
+        for i in range(2):
+            for transfer_id, data in encoded.items():
+                half = len(data) // 2
+                part = data[:half] if i == 0 else data[half:]
+                conn_a.sock.sendall(_segment(transfer_id, part, 0x02 if i == 0 else 0x01))
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [b"transfer 1 " * 20, b"transfer 65 " * 20])
+
+    def test_unknown_transfer_skipped(self):
+        """Data for a transfer that was never started is discarded."""
+        collector = _Collector()
+        conn_a, _ = _connected_pair(self, collector, recv_buffer_size=64)
+        conn_a.sock.sendall(_segment(99, bytes(1000), 0x01))
+        conn_a.send_bundle(_make_bundle(b"after orphan"))
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [b"after orphan"])
+
+    def test_send_burst(self):
+        """Back-to-back bundles are all delivered in order."""
+        collector = _Collector(50)
+        conn_a, _ = _connected_pair(self, collector)
+        for i in range(50):
+            conn_a.send_bundle(_make_bundle(f"bundle {i}".encode()))
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [f"bundle {i}".encode() for i in range(50)])
+
+    def test_send_bundles_batch(self):
+        """Bundles sent as a batch arrive as separate transfers, in order."""
+        collector = _Collector(300)
+        conn_a, _ = _connected_pair(self, collector)
+        sent = conn_a.send_bundles(_make_bundle(f"bundle {i}".encode()) for i in range(300))
+
+        self.assertEqual(sent, 300)
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [f"bundle {i}".encode() for i in range(300)])
+
+    def test_small_receive_buffer(self):
+        """Messages straddling a tiny receive buffer are framed correctly."""
+        collector = _Collector(10)
+        conn_a, _ = _connected_pair(self, collector, recv_buffer_size=64)
+        payloads = [bytes([i]) * (i * 37) for i in range(10)]
+        for payload in payloads:
+            conn_a.send_bundle(_make_bundle(payload))
+
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, payloads)
+
+
+class TestTransferAck(unittest.TestCase):
+    """Tests for XFER_ACK generation."""
+
+    def test_burst_acknowledged(self):
+        """Every transfer in a burst is acknowledged with its full length."""
+        raw, _, _ = _raw_receiver(self)
+        lengths = {}
+        burst = b''
+        for transfer_id in (1, 2, 3):
+            data = _make_bundle(bytes(transfer_id * 10)).encode()
+            lengths[transfer_id] = len(data)
+            burst += _segment(transfer_id, data)
+        raw.sendall(burst)
+
+        acks = _recv_exact(raw, 3 * 18)
+        for i, transfer_id in enumerate((1, 2, 3)):
+            msg_type, flags, acked_id, length = struct.unpack_from('!BBQQ', acks, i * 18)
+            self.assertEqual(msg_type, TCPCLMessageType.XFER_ACK)
+            self.assertEqual(acked_id, transfer_id)
+            self.assertEqual(length, lengths[transfer_id])
+
+    def test_acknowledged_before_session_term(self):
+        """Transfers followed by SESS_TERM in the same write are acknowledged."""
+        raw, _, thread = _raw_receiver(self)
+        data = _make_bundle(b"last words").encode()
+        raw.sendall(
+            _segment(1, data) + _segment(2, data)
+            + struct.pack('!BBB', TCPCLMessageType.SESS_TERM, 0, 0)
+        )
+
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        acks = _recv_exact(raw, 2 * 18)
+        acked_ids = [struct.unpack_from('!BBQQ', acks, i * 18)[2] for i in range(2)]
+        self.assertEqual(acked_ids, [1, 2])
+
+
+class TestTransferLimits(unittest.TestCase):
+    """Tests for bounds on peer-declared transfer lengths."""
+
+    def _assert_refused(self, raw, transfer_id):
+        self.assertEqual(
+            _recv_exact(raw, 10),
+            struct.pack('!BBQ', TCPCLMessageType.XFER_REFUSE, 0x02, transfer_id),
+        )
+
+    def test_huge_declared_length_not_preallocated(self):
+        """A transfer claiming an enormous length is received as sent."""
+        raw, _, _ = _raw_receiver(self)
+        data = _make_bundle(b"small").encode()
+        raw.sendall(_segment(5, data, ext_items=_length_hint(2**63)))
+
+        msg_type, _, acked_id, length = struct.unpack('!BBQQ', _recv_exact(raw, 18))
+        self.assertEqual(msg_type, TCPCLMessageType.XFER_ACK)
+        self.assertEqual((acked_id, length), (5, len(data)))
+
+    def test_transfer_over_mru_refused(self):
+        """Transfers over the advertised MRU are refused; the session goes on."""
+        raw, _, _ = _raw_receiver(self, transfer_mru=1000)
+
+        # Declared length over the MRU
+        raw.sendall(_segment(1, bytes(10), 0x02, _length_hint(5000)))
+        self._assert_refused(raw, 1)
+
+        # No declared length, data runs over the MRU
+        for flags, part in ((0x02, bytes(600)), (0x00, bytes(600)), (0x01, bytes(10))):
+            raw.sendall(_segment(2, part, flags))
+        self._assert_refused(raw, 2)
+
+        raw.sendall(_segment(3, _make_bundle(b"fits").encode()))
+        msg_type, _, acked_id, _ = struct.unpack('!BBQQ', _recv_exact(raw, 18))
+        self.assertEqual((msg_type, acked_id), (TCPCLMessageType.XFER_ACK, 3))
+
+    def test_refusal_between_connections(self):
+        """A refused bundle does not end the session; later bundles arrive."""
+        collector = _Collector()
+        sess_init = SessionInit(node_id="ipn:2.0", transfer_mru=1000).encode()
+        conn_a, conn_b = _connected_pair(self, collector, sess_init=sess_init)
+        with self.assertLogs(conn_a.logger, 'WARNING') as logs:
+            conn_a.send_bundle(_make_bundle(bytes(2000)))
+            conn_a.send_bundle(_make_bundle(b"after refusal"))
+            self.assertTrue(collector.wait())
+            time.sleep(0.1)  # Let conn_a read the XFER_REFUSE
+        self.assertIn("refused by peer", logs.output[0])
+        self.assertEqual(collector.payloads, [b"after refusal"])
+        self.assertTrue(conn_a._running and conn_b._running)
+
+    def test_segment_over_mru_refused(self):
+        """A segment longer than the segment MRU refuses its transfer."""
+        raw, _, _ = _raw_receiver(self, segment_mru=100)
+        raw.sendall(_segment(4, bytes(200), 0x02))
+        self._assert_refused(raw, 4)
+
+
+class TestDelivery(unittest.TestCase):
+    """Tests for bundle delivery off the receive thread."""
+
+    def _slow_receiver(self, **kwargs):
+        """Raw receiver whose callback blocks until release is set."""
+        release = threading.Event()
+        received = []
+
+        def on_bundle(bundle):
+            release.wait(5)
+            received.append(bundle)
+
+        raw, conn, _ = _raw_receiver(self, on_bundle, **kwargs)
+        self.addCleanup(release.set)  # Runs before the receiver is stopped
+        return raw, conn, release, received
+
+    def test_slow_callback_does_not_stall_receive(self):
+        """Transfers are acknowledged while the callback is still busy."""
+        raw, conn, release, received = self._slow_receiver()
+        data = _make_bundle(b"slow").encode()
+        raw.sendall(_segment(1, data) + _segment(2, data))
+
+        _recv_exact(raw, 2 * 18)
+        self.assertEqual(received, [])
+
+        release.set()
+        raw.close()
+        conn._deliver_thread.join(5)
+        self.assertEqual(len(received), 2)
+
+    def test_delivery_queue_bounded(self):
+        """Receive thread stops reading once the delivery queue is full."""
+        raw, conn, release, received = self._slow_receiver(deliver_depth=1)
+        data = _make_bundle(b"bounded").encode()
+        for transfer_id in range(1, 5):
+            raw.sendall(_segment(transfer_id, data))
+
+        # One transfer in the callback, one queued, one waiting for
+        # room; the fourth stays unread in the socket
+        _recv_exact(raw, 3 * 18)
+        raw.settimeout(0.2)
+        with self.assertRaises(socket.timeout):
+            raw.recv(1024)
+
+        release.set()
+        raw.settimeout(5)
+        _recv_exact(raw, 18)
+        raw.close()
+        conn._deliver_thread.join(5)
+        self.assertEqual(len(received), 4)
+
+
+class TestConvergenceLayer(unittest.TestCase):
+    """Tests for the listening convergence layer adapter."""
+
+    def test_send_via_listener(self):
+        """Bundle routed through connect() reaches the listening node."""
+        collector = _Collector()
+        _, port = _listener(self, collector)
+        sender = _sender(self)
+        sender.connect('127.0.0.1', port)
+
+        bundle = _make_bundle(b"via listener", EndpointID.ipn(1, 0), EndpointID.ipn(2, 0))
+        self.assertTrue(sender.send_bundle(bundle))
+        self.assertTrue(collector.wait())
+        self.assertEqual(collector.payloads, [b"via listener"])
+
+    def test_silent_peer_does_not_block_accept(self):
+        """A peer that never sends its contact header does not stall others."""
+        collector = _Collector()
+        _, port = _listener(self, collector)
+        sender = _sender(self)
+        silent = socket.create_connection(('127.0.0.1', port))
+        self.addCleanup(silent.close)
+
+        sender.connect('127.0.0.1', port)
+        sender.send_bundle(
+            _make_bundle(b"after silent peer", EndpointID.ipn(1, 0), EndpointID.ipn(2, 0))
+        )
+        self.assertTrue(collector.wait())
+
+    def test_concurrent_connections_accepted(self):
+        """Peers connecting at once are all accepted and served."""
+        collector = _Collector(4)
+        _, port = _listener(self, collector)
+        senders = [_sender(self, 10 + i) for i in range(4)]
+        threads = [
+            threading.Thread(target=sender.connect, args=('127.0.0.1', port))
+            for sender in senders
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        for i, sender in enumerate(senders):
+            sender.send_bundle(_make_bundle(
+                f"peer {i}".encode(), EndpointID.ipn(10 + i, 0), EndpointID.ipn(2, 0)
+            ))
+        self.assertTrue(collector.wait())
+        self.assertEqual(sorted(collector.payloads), [f"peer {i}".encode() for i in range(4)])
+
+    def test_session_init_shared(self):
+        """Connections reuse the layer's encoded SESS_INIT."""
+        _, port = _listener(self)
+        sender = _sender(self)
+        conn = sender.connect('127.0.0.1', port)
+
+        self.assertEqual(conn.remote_eid, EndpointID.ipn(2, 0))
+        self.assertIs(conn._sess_init, sender._sess_init)
+        self.assertEqual(SessionInit.decode(sender._sess_init).node_id, "ipn:1.0")
+
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'), "SO_REUSEPORT not available")
+    def test_reuse_port(self):
+        """Two listeners can share a port when reuse_port is set."""
+        first = TCPConvergenceLayer(EndpointID.ipn(1, 0), listen_port=0, reuse_port=True)
+        first.start()
+        port = first._server_sock.getsockname()[1]
+        second = TCPConvergenceLayer(EndpointID.ipn(2, 0), listen_port=port, reuse_port=True)
+        try:
+            second.start()
+        finally:
+            second.stop()
+            first.stop()
+
+    def test_accepted_socket_blocking(self):
+        """Accepted connections use blocking I/O with Nagle disabled."""
+        sockets = []
+        connection = tcpcl.TCPCLConnection
+
+        def capture(sock, *args, **kwargs):
+            sockets.append(sock)
+            return connection(sock, *args, **kwargs)
+
+        _, port = _listener(self)
+        sender = _sender(self)
+        with mock.patch.object(tcpcl, 'TCPCLConnection', side_effect=capture):
+            sender.connect('127.0.0.1', port)
+        accepted = [sock for sock in sockets if sock.getsockname()[1] == port]
+        self.assertEqual(len(accepted), 1)
+        self.assertTrue(accepted[0].getblocking())
+        self.assertTrue(accepted[0].getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    def test_outgoing_socket_tuned(self):
+        """Outgoing connections disable Nagle."""
+        _, port = _listener(self)
+        conn = _sender(self).connect('127.0.0.1', port)
+        self.assertTrue(conn.sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    def test_stop_is_prompt(self):
+        """stop() does not wait for an accept timeout."""
+        cla = TCPConvergenceLayer(EndpointID.ipn(1, 0), listen_port=0)
+        cla.start()
+
+        started = time.monotonic()
+        cla.stop()
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertFalse(cla._accept_thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()